@@ -7,11 +7,19 @@ from importlib.metadata import PackageNotFoundError, version as load_pkg_version
 from pathlib import Path
 from typing import Any
 
-from .ingest import load_documents
-
 __all__ = ["__version__", "load_documents"]
 
 
+def __getattr__(name: str) -> Any:
+    # Resolve the pipeline entry point on first use so importing a submodule
+    # (for example the CLI) does not load the whole ingest stack up front.
+    if name == "load_documents":
+        from .ingest import load_documents
+
+        return load_documents
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _read_local_project_version() -> str:
     """Read the project version from pyproject.toml when the package is uninstalled."""
     pyproject = Path(__file__).resolve().parent.parent / "pyproject.toml"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import html
 import logging
+import os
 import re
 import shutil
 from datetime import datetime
@@ -42,7 +43,8 @@ class ArticlePageWriter:
     def write(self, documents: Iterable[ContentDocument]) -> list[Path]:
         """Render every published document and write the HTML output."""
         self._output_root.mkdir(parents=True, exist_ok=True)
-        existing_dirs: Set[Path] = {path for path in self._output_root.iterdir() if path.is_dir()}
+        with os.scandir(self._output_root) as entries:
+            existing_dirs: Set[Path] = {Path(entry.path) for entry in entries if entry.is_dir()}
         current_dirs: Set[Path] = set()
         written_paths: list[Path] = []
 
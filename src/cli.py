@@ -1,10 +1,15 @@
 """CLI entrypoints for SmileCMS build tooling."""
 
+from __future__ import annotations
+
 import contextlib
-from dataclasses import dataclass
+import json
 import shutil
+import sys
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
@@ -12,69 +17,36 @@ from typing import TYPE_CHECKING, Annotated, Any, Iterable, Iterator, Sequence,
 
 import typer
 from rich.console import Console
-from rich.progress import (
-    Progress,
-    BarColumn,
-    TaskProgressColumn,
-    TimeElapsedColumn,
-    TimeRemainingColumn,
-)
-
-from .articles import write_article_pages
+
 from .config import Config, MediaProcessingConfig, load_config
-from .feeds import generate_feeds
-from .gallery import (
-    GalleryWorkspace,
-    apply_derivatives as apply_gallery_derivatives,
-    export_datasets as export_gallery_datasets,
-    prepare_workspace as prepare_gallery_workspace,
-)
-from .htmlvalidate import (
-    HtmlValidationReport,
-    HtmlValidatorError,
-    HtmlValidatorUnavailableError,
-    validate_html,
-)
-from .jsvalidate import (
-    JsValidationReport,
-    JsValidatorError,
-    JsValidatorUnavailableError,
-    validate_javascript,
-)
-from .ingest import load_documents
-from .manifests import ManifestGenerator, write_manifest_pages
-from .media import (
-    MediaAuditResult,
-    apply_variants_to_documents,
-    audit_media,
-    collect_media_plan,
-    process_media_plan,
-)
-from .music import MusicExportResult, export_music_catalog
-from .pages import write_error_pages, write_gallery_page, write_music_page
-from .reporting import (
-    BuildReport,
-    assemble_report,
-    build_document_stats,
-    build_manifest_stats,
-    build_media_stats,
-    write_report,
-)
-from .scaffold import ScaffoldError, ScaffoldResult, normalize_slug, scaffold_content
-from .staging import StagingResult, reset_directory, stage_static_site
-from .templates import TemplateAssets
-from .state import BuildTracker, ChangeSummary
-from .validation import DocumentIssue, DocumentValidationError, IssueSeverity, lint_workspace
-from .verify import VerificationReport, verify_site
 
+# Pipeline modules are imported inside the commands that use them, so lightweight
+# commands (and --help) do not pay for Jinja, jsonschema, Pillow and friends.
 if TYPE_CHECKING:
-    from .media.audit import ReferenceUsage
     from .content import ContentDocument
+    from .gallery import GalleryWorkspace
+    from .htmlvalidate import HtmlValidationReport
+    from .jsvalidate import JsValidationReport
+    from .media import MediaAuditResult
+    from .media.audit import ReferenceUsage
+    from .music import MusicExportResult
+    from .reporting import BuildReport
+    from .scaffold import ScaffoldResult
+    from .staging import StagingResult
+    from .state import BuildTracker, ChangeSummary
+    from .templates import TemplateAssets
+    from .validation import DocumentIssue
+    from .verify import VerificationReport
 
 console = Console()
+# ~30 Hz is as fast as a terminal progress bar is useful to redraw.
+PROGRESS_INTERVAL_NS = 33_000_000
+MEDIA_RESULT_FILENAME = "media-result.json"
 app = typer.Typer(help="SmileCMS static publishing toolkit.")
 audit_app = typer.Typer(help="Audit workspace content and media.")
 app.add_typer(audit_app, name="audit")
+tag_server_app = typer.Typer(help="Keep gallery captioning models loaded between builds.")
+app.add_typer(tag_server_app, name="tag-server")
 
 class NewContentType(str, Enum):
     """Kinds of content that can be scaffolded from the CLI."""
@@ -157,6 +129,8 @@ def new(  # noqa: PLR0913
     force: ForceFlag = False,
 ) -> None:
     """Create a new post, gallery, or track using the recommended layout."""
+    from .scaffold import ScaffoldError, normalize_slug, scaffold_content
+
     try:
         normalized_slug = normalize_slug(slug)
     except ScaffoldError as exc:
@@ -195,6 +169,8 @@ def lint(
     ] = False,
 ) -> None:
     """Run lightweight checks for common content issues."""
+    from .validation import IssueSeverity, lint_workspace
+
     config_file = _resolve_config_arg(config_path, project_dir)
     config: Config = _load(config_file)
     report = lint_workspace(config)
@@ -247,6 +223,10 @@ def build(
     ] = False,
 ) -> None:
     """Run a full rebuild of site artifacts."""
+    from .gallery import GalleryWorkspace
+    from .gallery import prepare_workspace as prepare_gallery_workspace
+    from .state import MEDIA_INPUT_KEYS, BuildTracker
+
     config_file = _resolve_config_arg(config_path, project_dir)
     config: Config = _load(config_file)
 
@@ -255,20 +235,9 @@ def build(
         override_path = Path(output_dir)
         config.output_dir = (override_path if override_path.is_absolute() else (base_dir / override_path)).resolve()
 
-    # Optionally adjust Pillow's decompression bomb limit based on config.
-    # Useful when processing ultra‑high‑resolution assets in a trusted context.
-    try:
-        from PIL import Image
+    from .media import apply_decompression_bomb_limit
 
-        limit = getattr(config.media_processing, "decompression_bomb_limit", None)
-        if limit is not None:
-            if int(limit) <= 0:
-                Image.MAX_IMAGE_PIXELS = None
-            else:
-                Image.MAX_IMAGE_PIXELS = int(limit)
-    except Exception:
-        # If Pillow isn't available or attribute is missing, continue.
-        pass
+    apply_decompression_bomb_limit(config)
     tracker = BuildTracker(config, Path(config_file))
     fingerprints = tracker.compute_fingerprints()
     change_summary = tracker.summarize_changes(fingerprints)
@@ -281,7 +250,13 @@ def build(
         gallery_workspace = GalleryWorkspace(root=config.gallery.source_dir)
     documents = _load_build_documents(config, gallery_workspace)
 
-    outputs = _generate_site_artifacts(config, documents, gallery_workspace, refresh_gallery)
+    outputs = _generate_site_artifacts(
+        config,
+        documents,
+        gallery_workspace,
+        refresh_gallery,
+        reuse_media=not force and not change_summary.touches(MEDIA_INPUT_KEYS),
+    )
 
     _print_primary_summary(outputs, config, gallery_workspace)
 
@@ -295,6 +270,8 @@ def build(
 
 
 def _prepare_output_directories(config: Config, change_summary: ChangeSummary, force: bool) -> None:
+    from .staging import reset_directory
+
     if force:
         console.print(
             "[bold yellow]Force rebuild[/]: clearing output directories before regenerating."
@@ -328,8 +305,11 @@ def _prepare_output_directories(config: Config, change_summary: ChangeSummary, f
 
 def _load_build_documents(
     config: Config,
-    gallery_workspace: "GalleryWorkspace",
-) -> list["ContentDocument"]:
+    gallery_workspace: GalleryWorkspace,
+) -> list[ContentDocument]:
+    from .ingest import load_documents
+    from .validation import DocumentValidationError
+
     try:
         return load_documents(config, gallery_workspace=gallery_workspace)
     except DocumentValidationError as error:
@@ -339,58 +319,128 @@ def _load_build_documents(
 
 def _generate_site_artifacts(
     config: Config,
-    documents: Sequence["ContentDocument"],
-    gallery_workspace: "GalleryWorkspace",
+    documents: Sequence[ContentDocument],
+    gallery_workspace: GalleryWorkspace,
     refresh_gallery: bool,
+    *,
+    reuse_media: bool = False,
 ) -> BuildOutputs:
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        TaskProgressColumn,
+        TimeElapsedColumn,
+        TimeRemainingColumn,
+    )
+
+    from .feeds import generate_feeds
+    from .gallery import apply_derivatives as apply_gallery_derivatives
+    from .manifests import ManifestGenerator, write_manifest_pages
+    from .media import (
+        apply_variants_to_documents,
+        collect_media_plan,
+        create_media_executor,
+        load_media_result,
+        process_media_plan,
+        save_media_result,
+    )
+    from .reporting import (
+        assemble_report,
+        build_document_stats,
+        build_manifest_stats,
+        build_media_stats,
+        write_report,
+    )
+
     start = time.perf_counter()
 
     media_plan = collect_media_plan(documents, config)
-    # Show a live progress bar during media processing for better feedback on large sites.
-    # Use transient=True so completed bars don't clutter the final summary.
-    with Progress(
-        "[progress.description]{task.description}",
-        BarColumn(),
-        TaskProgressColumn(),
-        "•",
-        TimeElapsedColumn(),
-        "•",
-        TimeRemainingColumn(),
-        transient=True,
-    ) as progress:
-        deriv_total = len(media_plan.tasks)
-        asset_total = len(media_plan.static_assets)
-        deriv_task_id = progress.add_task("Derivatives", total=deriv_total) if deriv_total > 0 else None
-        asset_task_id = progress.add_task("Assets", total=asset_total) if asset_total > 0 else None
-
-        def _on_progress(kind: str) -> None:
-            if kind == "derivative" and deriv_task_id is not None:
-                progress.advance(deriv_task_id, 1)
-            elif kind == "asset" and asset_task_id is not None:
-                progress.advance(asset_task_id, 1)
-
-        media_result = process_media_plan(media_plan, config, on_progress=_on_progress)
+    media_cache_path = config.cache_dir / MEDIA_RESULT_FILENAME
+    # Media inputs are unchanged since the last build: reuse its recorded variants
+    # instead of re-checking (and re-opening) every derivative.
+    media_result = load_media_result(media_plan, config, media_cache_path) if reuse_media else None
+    if media_result is None:
+        # Show a live progress bar during media processing for better feedback on large sites.
+        # Use transient=True so completed bars don't clutter the final summary.
+        with Progress(
+            "[progress.description]{task.description}",
+            BarColumn(),
+            TaskProgressColumn(),
+            "•",
+            TimeElapsedColumn(),
+            "•",
+            TimeRemainingColumn(),
+            transient=True,
+        ) as progress:
+            # Map each progress kind reported by the media processor to its bar; kinds
+            # with nothing to do get no bar and are ignored.
+            progress_tasks = {
+                kind: progress.add_task(label, total=total)
+                for kind, label, total in (
+                    ("derivative", "Derivatives", len(media_plan.tasks)),
+                    ("asset", "Assets", len(media_plan.static_assets)),
+                )
+                if total > 0
+            }
+
+            # Coalesce per-item ticks so large media plans do not redraw the bars thousands
+            # of times; pending advances are flushed at most every PROGRESS_INTERVAL_NS.
+            pending = dict.fromkeys(progress_tasks, 0)
+            last_flush = time.monotonic_ns()
+
+            def _flush_progress() -> None:
+                for kind, count in pending.items():
+                    if count:
+                        progress.advance(progress_tasks[kind], count)
+                        pending[kind] = 0
+
+            def _on_progress(kind: str) -> None:
+                nonlocal last_flush
+                if kind not in pending:
+                    return
+                pending[kind] += 1
+                now = time.monotonic_ns()
+                if now - last_flush >= PROGRESS_INTERVAL_NS:
+                    _flush_progress()
+                    last_flush = now
+
+            # Rendering is CPU-bound Pillow work; a process pool sidesteps the GIL.
+            executor = create_media_executor(config)
+            try:
+                media_result = process_media_plan(
+                    media_plan, config, on_progress=_on_progress, executor=executor
+                )
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            _flush_progress()
+        save_media_result(media_result, media_plan, media_cache_path)
     apply_variants_to_documents(documents, media_result.variants)
     updated_gallery = 0
     if config.gallery.enabled:
         updated_gallery = apply_gallery_derivatives(gallery_workspace, media_result, config, refresh=refresh_gallery)
 
     pages = ManifestGenerator().build_pages(documents, prefix="content")
-    manifest_paths = write_manifest_pages(pages, config.output_dir / "manifests")
-
-    report = assemble_report(
-        project=config.project_name,
-        duration_seconds=time.perf_counter() - start,
-        documents=build_document_stats(documents),
-        manifests=build_manifest_stats(pages),
-        media=build_media_stats(media_plan, media_result),
-    )
-    report_path = write_report(report, config.output_dir)
+    # Feeds only read the manifest pages, so render them while manifests and the
+    # build report are written.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="feeds") as executor:
+        feeds_future = executor.submit(generate_feeds, config, pages)
+        manifest_paths = write_manifest_pages(pages, config.output_dir / "manifests")
+
+        report = assemble_report(
+            project=config.project_name,
+            duration_seconds=time.perf_counter() - start,
+            documents=build_document_stats(documents),
+            manifests=build_manifest_stats(pages),
+            media=build_media_stats(media_plan, media_result),
+        )
+        report_path = write_report(report, config.output_dir)
+        feed_paths = feeds_future.result()
 
     return BuildOutputs(
         report=report,
         manifest_paths=manifest_paths,
-        feed_paths=generate_feeds(config, pages),
+        feed_paths=feed_paths,
         gallery_updates=updated_gallery,
         report_path=report_path,
     )
@@ -399,7 +449,7 @@ def _generate_site_artifacts(
 def _print_primary_summary(
     outputs: BuildOutputs,
     config: Config,
-    gallery_workspace: "GalleryWorkspace",
+    gallery_workspace: GalleryWorkspace,
 ) -> None:
     report = outputs.report
     documents = report.documents
@@ -462,9 +512,14 @@ def _print_primary_summary(
 def _stage_static_assets(
     config: Config,
     tracker: BuildTracker,
-    documents: Sequence["ContentDocument"],
-    gallery_workspace: "GalleryWorkspace",
+    documents: Sequence[ContentDocument],
+    gallery_workspace: GalleryWorkspace,
 ) -> StageArtifacts:
+    from .articles import write_article_pages
+    from .pages import write_error_pages
+    from .staging import stage_static_site
+    from .templates import TemplateAssets
+
     previous_templates = tracker.previous_template_paths or None
     stage_result = stage_static_site(
         config,
@@ -472,21 +527,39 @@ def _stage_static_assets(
     )
     template_assets = TemplateAssets(config)
     template_assets.write_site_config()
-    article_pages = write_article_pages(documents, config, assets=template_assets)
-    gallery_page: Path | None = None
-    if config.gallery.enabled:
-        gallery_page = write_gallery_page(config, template_assets)
-        export_gallery_datasets(gallery_workspace, config)
-    else:
-        _prune_gallery_outputs(config)
-    music_page: Path | None = None
-    music_result: MusicExportResult | None = None
-    if config.music.enabled:
-        music_page = write_music_page(config, template_assets)
-        music_result = export_music_catalog(documents, config)
-    else:
-        _prune_music_outputs(config)
-    error_pages = write_error_pages(config, template_assets)
+
+    # Page and dataset stages write separate output trees (posts/, gallery/, music/,
+    # error pages at the root) and share only the read-only template assets, so
+    # they run side by side once the static bundle has been staged. The gallery and
+    # music stages prune stale files under their trees, so when configured data
+    # directories nest inside each other the music stage waits for the gallery.
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="stage") as executor:
+        article_future = executor.submit(
+            write_article_pages, documents, config, assets=template_assets
+        )
+        gallery_future = (
+            executor.submit(_stage_gallery, config, template_assets, gallery_workspace)
+            if config.gallery.enabled
+            else executor.submit(_prune_gallery_outputs, config)
+        )
+        if _gallery_music_outputs_overlap(config):
+            gallery_future.result()
+        music_future = (
+            executor.submit(_stage_music, config, template_assets, documents)
+            if config.music.enabled
+            else executor.submit(_prune_music_outputs, config)
+        )
+        error_future = executor.submit(write_error_pages, config, template_assets)
+
+        article_pages = article_future.result()
+        gallery_page: Path | None = gallery_future.result()
+        music_page: Path | None = None
+        music_result: MusicExportResult | None = None
+        staged_music = music_future.result()
+        if staged_music is not None:
+            music_page, music_result = staged_music
+        error_pages = error_future.result()
+
     return StageArtifacts(
         stage_result=stage_result,
         article_pages=article_pages,
@@ -497,29 +570,63 @@ def _stage_static_assets(
     )
 
 
+def _stage_gallery(
+    config: Config,
+    template_assets: TemplateAssets,
+    gallery_workspace: GalleryWorkspace,
+) -> Path:
+    from .gallery import export_datasets as export_gallery_datasets
+    from .pages import write_gallery_page
+
+    gallery_page = write_gallery_page(config, template_assets)
+    export_gallery_datasets(gallery_workspace, config)
+    return gallery_page
+
+
+def _stage_music(
+    config: Config,
+    template_assets: TemplateAssets,
+    documents: Sequence[ContentDocument],
+) -> tuple[Path, MusicExportResult]:
+    from .music import export_music_catalog
+    from .pages import write_music_page
+
+    return write_music_page(config, template_assets), export_music_catalog(documents, config)
+
+
+def _gallery_music_outputs_overlap(config: Config) -> bool:
+    """Return True when the gallery and music stages write into overlapping trees."""
+    output_dir = config.output_dir.resolve()
+    gallery_trees = [output_dir / "gallery", (output_dir / config.gallery.data_subdir).resolve()]
+    music_trees = [output_dir / "music", (output_dir / config.music.data_subdir).resolve()]
+    return any(
+        gallery_tree == music_tree
+        or gallery_tree in music_tree.parents
+        or music_tree in gallery_tree.parents
+        for gallery_tree in gallery_trees
+        for music_tree in music_trees
+    )
+
+
 def _prune_gallery_outputs(config: Config) -> None:
     """Remove gallery artifacts when the feature is disabled."""
     gallery_page_dir = config.output_dir / "gallery"
     gallery_data_dir = config.output_dir / config.gallery.data_subdir
-    for path in (gallery_page_dir, gallery_data_dir):
-        if path.exists():
-            shutil.rmtree(path, ignore_errors=True)
+    _remove_paths([gallery_page_dir, gallery_data_dir])
 
 
 def _prune_music_outputs(config: Config) -> None:
     """Remove music artifacts when the feature is disabled."""
     music_page_dir = config.output_dir / "music"
     music_data_dir = config.output_dir / config.music.data_subdir
-    for path in (music_page_dir, music_data_dir):
-        if path.exists():
-            shutil.rmtree(path, ignore_errors=True)
+    _remove_paths([music_page_dir, music_data_dir])
 
 
 def _print_stage_summary(
     config: Config,
     outputs: BuildOutputs,
     stage_artifacts: StageArtifacts,
-    gallery_workspace: "GalleryWorkspace",
+    gallery_workspace: GalleryWorkspace,
 ) -> None:
     stage_result = stage_artifacts.stage_result
     if stage_result.total:
@@ -597,7 +704,7 @@ def _print_stage_summary(
 
 def _print_accumulated_warnings(
     report: BuildReport,
-    gallery_workspace: "GalleryWorkspace",
+    gallery_workspace: GalleryWorkspace,
     music_result: MusicExportResult | None,
 ) -> None:
     warnings = list(report.warnings)
@@ -642,6 +749,11 @@ def verify(
     ] = None,
 ) -> None:
     """Scan the generated site bundle for missing links or assets."""
+    from .fileio import write_bytes_atomic
+    from .htmlvalidate import HtmlValidatorError, HtmlValidatorUnavailableError, validate_html
+    from .jsvalidate import JsValidatorError, JsValidatorUnavailableError, validate_javascript
+    from .verify import verify_site
+
     config_file = _resolve_config_arg(config_path, project_dir)
     config: Config = _load(config_file)
     output_dir = Path(config.output_dir)
@@ -651,46 +763,55 @@ def verify(
         raise typer.Exit(code=1)
 
     console.print(f"[bold blue]Verifying[/]: scanning HTML files under {_display_path(output_dir)}")
-    report = verify_site(output_dir)
-    _print_verification_report(report)
-
-    html_report: HtmlValidationReport | None = None
-    js_report: JsValidationReport | None = None
     if html_validation:
         console.print(
             f"[bold blue]HTML validation[/]: validating {_display_path(output_dir)} with html5validator"
         )
-        try:
-            html_report = validate_html(output_dir)
-        except HtmlValidatorUnavailableError as exc:
-            console.print(f"[bold yellow]HTML validation skipped[/]: {exc}")
-        except HtmlValidatorError as exc:
-            console.print(f"[bold red]HTML validation failed[/]: {exc}")
-            raise typer.Exit(code=1) from exc
-        else:
-            _print_html_validation_report(html_report)
-
     if js_validation:
         console.print(
             f"[bold blue]JavaScript validation[/]: parsing scripts under {_display_path(output_dir)}"
         )
-        try:
-            js_report = validate_javascript(output_dir)
-        except JsValidatorUnavailableError as exc:
-            console.print(f"[bold yellow]JavaScript validation skipped[/]: {exc}")
-        except JsValidatorError as exc:
-            console.print(f"[bold red]JavaScript validation failed[/]: {exc}")
-            raise typer.Exit(code=1) from exc
-        else:
-            _print_js_validation_report(js_report)
+    html_report: HtmlValidationReport | None = None
+    js_report: JsValidationReport | None = None
+    # The link scan and both validators are independent (the validators mostly wait on
+    # subprocesses), so run them together and report results in the usual order.
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="verify") as executor:
+        site_future = executor.submit(verify_site, output_dir)
+        html_future = executor.submit(validate_html, output_dir) if html_validation else None
+        js_future = executor.submit(validate_javascript, output_dir) if js_validation else None
+
+        report = site_future.result()
+        _print_verification_report(report)
+
+        if html_future is not None:
+            try:
+                html_report = html_future.result()
+            except HtmlValidatorUnavailableError as exc:
+                console.print(f"[bold yellow]HTML validation skipped[/]: {exc}")
+            except HtmlValidatorError as exc:
+                console.print(f"[bold red]HTML validation failed[/]: {exc}")
+                raise typer.Exit(code=1) from exc
+            else:
+                _print_html_validation_report(html_report)
+
+        if js_future is not None:
+            try:
+                js_report = js_future.result()
+            except JsValidatorUnavailableError as exc:
+                console.print(f"[bold yellow]JavaScript validation skipped[/]: {exc}")
+            except JsValidatorError as exc:
+                console.print(f"[bold red]JavaScript validation failed[/]: {exc}")
+                raise typer.Exit(code=1) from exc
+            else:
+                _print_js_validation_report(js_report)
 
     if report_path:
         target = Path(report_path)
         try:
             target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text(
-                _render_verification_text(report, output_dir, html_report, js_report),
-                encoding="utf-8",
+            write_bytes_atomic(
+                target,
+                _render_verification_text(report, output_dir, html_report, js_report).encode("utf-8"),
             )
             console.print(f"[bold green]Report written[/]: {_display_path(target)}")
         except OSError as exc:
@@ -718,16 +839,67 @@ def audit_media_command(
     ] = False,
 ) -> None:
     """Inspect media references and files for missing or misplaced assets."""
+    from .ingest import load_documents
+    from .media import audit_media
+
     config_file = _resolve_config_arg(config_path, project_dir)
     config: Config = _load(config_file)
     documents = load_documents(config)
     result = audit_media(documents, config)
     if json_output:
-        console.print_json(data=_media_audit_payload(result))
+        # Stream straight to stdout: rich's print_json builds and highlights the
+        # whole document in memory first, which is slow for large audits.
+        json.dump(_media_audit_payload(result), sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
         return
     _print_media_audit(result)
 
 
+@tag_server_app.command("start")
+def tag_server_start(
+    config_path: ConfigPathOption = "smilecms.yml",
+    project_dir: ProjectDirOption = None,
+) -> None:
+    """Load the captioning model once and serve gallery builds until stopped."""
+    from .gallery.tagger_server import TaggerServerError
+    from .gallery.tagger_server import serve as serve_tagger
+
+    config_file = _resolve_config_arg(config_path, project_dir)
+    config: Config = _load(config_file)
+    console.print(f"[bold]Loading caption model[/]: {config.gallery.caption_model}")
+
+    def _on_ready(address: str) -> None:
+        console.print(
+            f"[bold green]Tagger server[/]: listening on {address} (press Ctrl+C to stop)"
+        )
+
+    try:
+        serve_tagger(config, on_ready=_on_ready)
+    except TaggerServerError as exc:
+        console.print(f"[bold red]Failed to start tagger server[/]: {exc}")
+        raise typer.Exit(code=1) from exc
+    except KeyboardInterrupt:
+        console.print("\n[bold yellow]Stopping tagger server...[/]")
+        return
+    console.print("[bold green]Tagger server stopped.[/]")
+
+
+@tag_server_app.command("stop")
+def tag_server_stop(
+    config_path: ConfigPathOption = "smilecms.yml",
+    project_dir: ProjectDirOption = None,
+) -> None:
+    """Shut down a running tagger server for this project's cache directory."""
+    from .gallery.tagger_server import stop_server as stop_tagger
+
+    config_file = _resolve_config_arg(config_path, project_dir)
+    config: Config = _load(config_file)
+    if stop_tagger(config):
+        console.print("[bold green]Tagger server stopped.[/]")
+    else:
+        console.print("[bold yellow]No tagger server is running.[/]")
+
+
 @app.command()
 def preview(
     config_path: ConfigPathOption = "smilecms.yml",
@@ -738,7 +910,7 @@ def preview(
     ] = "127.0.0.1",
     port: Annotated[
         int,
-        typer.Option("--port", "-p", help="Port for the preview server."),
+        typer.Option("--port", "-p", min=0, max=65535, help="Port for the preview server."),
     ] = 8000,
     open_browser: Annotated[
         bool,
@@ -751,8 +923,6 @@ def preview(
     """Serve the generated site directory with a simple HTTP server."""
     config_file = _resolve_config_arg(config_path, project_dir)
     config: Config = _load(config_file)
-    if port < 0 or port > 65535:
-        raise typer.BadParameter("Port must be between 0 and 65535.")
 
     output_dir = Path(config.output_dir)
     if not output_dir.exists():
@@ -814,14 +984,15 @@ def clean(
     if include_cache:
         targets.append(("cache", Path(config.cache_dir)))
 
-    removed = 0
+    existing: list[Path] = []
     for label, path in targets:
         if path.exists():
             console.print(f"[bold green]Removing[/]: {label} ({path})")
-            _remove_path(path)
-            removed += 1
+            existing.append(path)
         else:
             console.print(f"[bold yellow]Skipping[/]: {label} ({path}) not found")
+    _remove_paths(existing)
+    removed = len(existing)
 
     noun = "directory" if removed == 1 else "directories"
     console.print(f"[bold green]Clean complete[/]: removed {removed} {noun}.")
@@ -940,6 +1111,8 @@ def _print_scaffold_summary(kind: NewContentType, slug: str, result: ScaffoldRes
 
 
 def _lint_sort_key(issue: DocumentIssue) -> tuple[int, str, str]:
+    from .validation import IssueSeverity
+
     severity_order = 0 if issue.severity is IssueSeverity.ERROR else 1
     pointer = issue.pointer or ""
     return (severity_order, issue.source_path, pointer)
@@ -987,7 +1160,7 @@ def _print_media_audit(result: MediaAuditResult) -> None:
 
 
 def _media_audit_payload(result: MediaAuditResult) -> dict[str, object]:
-    def serialize_usage(path: str, usage: "ReferenceUsage") -> dict[str, object]:
+    def serialize_usage(path: str, usage: ReferenceUsage) -> dict[str, object]:
         payload: dict[str, object] = {
             "path": path,
             "documents": sorted(usage.documents),
@@ -1039,7 +1212,7 @@ def _media_audit_payload(result: MediaAuditResult) -> dict[str, object]:
     return payload
 
 
-def _format_reference_line(path: str, usage: "ReferenceUsage", suffix: str | None = None) -> str:
+def _format_reference_line(path: str, usage: ReferenceUsage, suffix: str | None = None) -> str:
     details: list[str] = []
     if usage.documents:
         details.append(f"documents: {', '.join(sorted(usage.documents))}")
@@ -1070,12 +1243,15 @@ def _print_verification_report(report: VerificationReport) -> None:
         "[bold red]Verification issues[/]: "
         f"{len(report.issues)} issue(s) detected across {report.scanned_files} file(s)."
     )
+    # Render the issue list in one print; rich's per-call setup dominates large reports.
+    lines: list[str] = []
     for issue in report.issues:
         color = "yellow" if issue.kind == "warning" else "red"
-        console.print(
+        lines.append(
             f"[bold {color}]{issue.kind}[/] "
             f"{_display_path(issue.source)} -> {issue.target} :: {issue.message}"
         )
+    console.print("\n".join(lines))
 
 
 def _render_verification_text(
@@ -1084,9 +1260,18 @@ def _render_verification_text(
     html_report: HtmlValidationReport | None = None,
     js_report: JsValidationReport | None = None,
 ) -> str:
+    # Many issues share a source page; resolve each distinct path only once.
+    resolved: dict[Path, str] = {}
+
+    def _display(path: Path) -> str:
+        text = resolved.get(path)
+        if text is None:
+            text = resolved[path] = path.resolve().as_posix()
+        return text
+
     lines = [
         "SmileCMS site verification report",
-        f"Output directory: {output_dir.resolve().as_posix()}",
+        f"Output directory: {_display(output_dir)}",
         f"HTML files scanned: {report.scanned_files}",
         f"Issues detected: {len(report.issues)}",
         "",
@@ -1097,7 +1282,7 @@ def _render_verification_text(
         for issue in report.issues:
             lines.append(
                 f"- [{issue.kind}] "
-                f"{issue.source.resolve().as_posix()} -> {issue.target}: {issue.message}"
+                f"{_display(issue.source)} -> {issue.target}: {issue.message}"
             )
     lines.append("")
     if html_report:
@@ -1112,7 +1297,7 @@ def _render_verification_text(
                 location_text = f":{location}" if location else ""
                 lines.append(
                     f"- [{html_issue.severity}] "
-                    f"{html_issue.file.resolve().as_posix()}{location_text}: {html_issue.message}"
+                    f"{_display(html_issue.file)}{location_text}: {html_issue.message}"
                 )
     if js_report:
         lines.append("")
@@ -1127,7 +1312,7 @@ def _render_verification_text(
                 location_text = f":{location}" if location else ""
                 lines.append(
                     f"- [{js_issue.severity}] "
-                    f"{js_issue.file.resolve().as_posix()}{location_text}: {js_issue.message}"
+                    f"{_display(js_issue.file)}{location_text}: {js_issue.message}"
                 )
     lines.append("")
     return "\n".join(lines)
@@ -1146,16 +1331,18 @@ def _print_html_validation_report(report: HtmlValidationReport) -> None:
         f"{report.error_count} error(s), {report.warning_count} warning(s) "
         f"across {report.scanned_files} file(s)."
     )
+    lines: list[str] = []
     for html_issue in report.issues:
         color = "red" if html_issue.severity == "error" else "yellow"
         if html_issue.severity not in {"error", "warning"}:
             color = "blue"
         location = html_issue.location()
         location_text = f":{location}" if location else ""
-        console.print(
+        lines.append(
             f"[bold {color}]{html_issue.severity}[/] "
             f"{_display_path(html_issue.file)}{location_text} :: {html_issue.message}"
         )
+    console.print("\n".join(lines))
 
 
 def _print_js_validation_report(report: JsValidationReport) -> None:
@@ -1171,16 +1358,18 @@ def _print_js_validation_report(report: JsValidationReport) -> None:
         f"{report.error_count} error(s), {report.warning_count} warning(s) "
         f"across {report.scanned_files} file(s)."
     )
+    lines: list[str] = []
     for js_issue in report.issues:
         color = "red" if js_issue.severity == "error" else "yellow"
         if js_issue.severity not in {"error", "warning"}:
             color = "blue"
         location = js_issue.location()
         location_text = f":{location}" if location else ""
-        console.print(
+        lines.append(
             f"[bold {color}]{js_issue.severity}[/] "
             f"{_display_path(js_issue.file)}{location_text} :: {js_issue.message}"
         )
+    console.print("\n".join(lines))
 
 
 def _load(path: str) -> Config:
@@ -1249,6 +1438,20 @@ def _remove_path(path: Path) -> None:
         shutil.rmtree(path, ignore_errors=True)
     elif path.exists():
         path.unlink(missing_ok=True)
+
+
+def _remove_paths(paths: Sequence[Path]) -> None:
+    """Remove independent trees concurrently; rmtree time is dominated by syscalls."""
+    existing = [path for path in paths if path.exists()]
+    if len(existing) <= 1:
+        for path in existing:
+            _remove_path(path)
+        return
+    with ThreadPoolExecutor(max_workers=len(existing)) as executor:
+        # Nested targets are harmless: removal tolerates paths already gone.
+        list(executor.map(_remove_path, existing))
+
+
 def _resolve_config_arg(config_path: str, project_dir: str | None) -> str:
     """Choose the effective config file path from --config/--project.
 
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from .config import Config
+from .config import YAML_LOADER, Config
 from .content import (
     ContentDocument,
     ContentMeta,
@@ -17,11 +18,13 @@ from .content import (
     ContentType,
     MediaReference,
 )
+from .fileio import list_subdirectories
 from .gallery import GalleryWorkspace, prepare_workspace
 from .gallery.models import GalleryCollectionEntry, GalleryImageEntry
 
 logger = logging.getLogger(__name__)
 
+
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".tiff", ".bmp"}
 AUDIO_EXTENSIONS = {".mp3", ".wav", ".flac", ".ogg", ".aac", ".m4a"}
 VIDEO_EXTENSIONS = {".mp4", ".mov", ".webm", ".mkv"}
@@ -100,7 +103,7 @@ def load_music_documents(config: Config) -> list[ContentDocument]:
         return []
 
     documents: list[ContentDocument] = []
-    for directory in sorted(p for p in root.iterdir() if p.is_dir()):
+    for directory in list_subdirectories(root):
         slug = directory.name.strip().lower()
         meta_path = directory / meta_name
         data = _load_yaml(meta_path)
@@ -216,7 +219,7 @@ def _load_yaml(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
     with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+        data = yaml.load(handle, Loader=YAML_LOADER) or {}
         if not isinstance(data, dict):
             logger.warning("Metadata file %s should define a mapping; ignoring.", path)
             return {}
@@ -347,11 +350,13 @@ def _parse_duration(value: Any) -> float | None:
 
 
 def _iter_media_files(directory: Path, extensions: set[str]) -> list[Path]:
-    files = [
-        path
-        for path in directory.iterdir()
-        if path.is_file() and path.suffix.lower() in extensions
-    ]
+    # DirEntry caches the file type from readdir, avoiding a stat per entry.
+    with os.scandir(directory) as entries:
+        files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in extensions
+        ]
     return sorted(files, key=lambda path: path.name.lower())
 
 
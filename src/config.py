@@ -4,6 +4,9 @@ from typing import Any
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it; same safe semantics.
+YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class DerivativeProfile(BaseModel):
     """Desired output variant for image/video assets."""
@@ -85,6 +88,14 @@ class MediaProcessingConfig(BaseModel):
             "leave unset to use Pillow's default."
         ),
     )
+    workers: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Worker processes used to render derivatives in parallel during builds. "
+            "Leave unset to use every available core; set to 1 to render serially."
+        ),
+    )
 
     @field_validator("source_dir", "output_dir", mode="before")
     def _ensure_path(cls, value: Any) -> Path:
@@ -155,6 +166,22 @@ class GalleryConfig(BaseModel):
         default=None,
         description="Optional torch device string (e.g. 'cuda', 'cpu') for ML inference.",
     )
+    tagging_quantize: bool = Field(
+        default=False,
+        description=(
+            "Apply dynamic int8 quantization to the caption model when running on CPU. "
+            "Faster on CPU-only hosts at a small cost in caption quality; ignored on GPU."
+        ),
+    )
+    load_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Worker processes used to load collection sidecars in parallel. "
+            "Leave unset to use every available core once there are enough collections "
+            "to benefit; set to 1 to load serially."
+        ),
+    )
     profile_map: dict[str, str] = Field(
         default_factory=lambda: {"thumbnail": "thumb", "web": "large", "download": "large"},
         description="Mapping from semantic derivative roles to configured profile names.",
@@ -312,7 +339,7 @@ def load_config(path: str | Path) -> Config:
         config_file = candidate / "smilecms.yml"
         if config_file.exists():
             with config_file.open("r", encoding="utf-8") as handle:
-                data = yaml.safe_load(handle) or {}
+                data = yaml.load(handle, Loader=YAML_LOADER) or {}
         # Anchor defaults to the provided directory.
         base_dir = candidate.resolve()
         config_path = config_file
@@ -320,7 +347,7 @@ def load_config(path: str | Path) -> Config:
         config_path = candidate
         if config_path.exists():
             with config_path.open("r", encoding="utf-8") as handle:
-                data = yaml.safe_load(handle) or {}
+                data = yaml.load(handle, Loader=YAML_LOADER) or {}
         else:
             raise FileNotFoundError(config_path)
         base_dir = config_path.parent.resolve()
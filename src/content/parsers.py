@@ -8,6 +8,7 @@ from typing import Any
 import yaml
 from pydantic import ValidationError
 
+from ..config import YAML_LOADER
 from .models import ContentDocument, ContentMeta, MediaReference
 
 
@@ -46,7 +47,7 @@ def _split_front_matter(text: str) -> tuple[dict[str, Any], str]:
         if line.strip() == "---":
             raw_front_matter = "\n".join(front_lines)
             body = "\n".join(lines[idx + 1 :])
-            data = yaml.safe_load(raw_front_matter) or {}
+            data = yaml.load(raw_front_matter, Loader=YAML_LOADER) or {}
             return data, body
         front_lines.append(line)
     raise FrontMatterError("Closing front matter delimiter '---' missing.")
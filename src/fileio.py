@@ -0,0 +1,42 @@
+"""Filesystem and JSON helpers shared across SmileCMS packages."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:  # pragma: no cover - exercised only when the optional extra is installed
+    import orjson as orjson  # re-exported for the gallery sidecar helpers
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_line(payload: dict[str, Any]) -> str:
+    """Serialise a payload as a compact single-line JSON document."""
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to a sibling temp file, then swap it into place.
+
+    Readers never observe a truncated file, and the temp file is removed if the
+    write or the swap fails.
+    """
+    temp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def list_subdirectories(root: Path) -> list[Path]:
+    """Return the immediate subdirectories of ``root``, sorted by path."""
+    # DirEntry caches the file type from readdir, avoiding a stat per entry.
+    with os.scandir(root) as entries:
+        return sorted(Path(entry.path) for entry in entries if entry.is_dir())
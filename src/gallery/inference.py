@@ -9,14 +9,24 @@ from dataclasses import dataclass
 from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
+from importlib.util import find_spec
 from typing import Any, Callable, Optional, TypedDict, cast
 
-from PIL import Image
-
 from ..config import Config
 
 logger = logging.getLogger(__name__)
 
+_SEPARATOR_PATTERN = re.compile(r"[_\-]+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_PROPER_NOUN_PATTERN = re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b")
+_WORD_PATTERN = re.compile(r"[A-Za-z]{3,}")
+_COMMON_STOPS = frozenset(
+    {
+        "the","and","for","with","from","that","this","there","their","your","have","has","was","were","are","been","into","over","under","between","within","about","above","below","after","before","during","without","because","while","where","when","which","will","would","could","should","can","may","might"
+    }
+)
+_NOUN_POS = frozenset({"PROPN", "NOUN"})
+
 
 @dataclass(slots=True)
 class AnnotationResult:
@@ -36,8 +46,9 @@ class TagResult(TypedDict):
 class TaggingSession:
     """Manage ML model lifecycle for gallery tagging."""
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, *, use_server: bool = True) -> None:
         self._config = config
+        self._client: Any | None = None
         self.available = False
         self.failure_reason: str | None = None
         self.model_signature: str | None = None
@@ -45,6 +56,7 @@ class TaggingSession:
         self._caption_model = None
         self._torch = None
         self._device = None
+        self._pixel_buffer: Any | None = None
         self._max_tags = config.gallery.tagging_max_tags
 
         if not config.gallery.tagging_enabled:
@@ -55,6 +67,30 @@ class TaggingSession:
         caption_cache = cache_root / "caption"
         caption_cache.mkdir(parents=True, exist_ok=True)
 
+        if use_server:
+            # A resident `smilecms tag-server` already holds the models in memory.
+            from .tagger_server import connect
+
+            client = connect(config)
+            if client is not None:
+                self._client = client
+                self.model_signature = client.model_signature
+                self.available = True
+                return
+
+        # Probe without importing: transformers pulls in torch (and CUDA) on import,
+        # which is wasted start-up time when the other half of the stack is missing.
+        if find_spec("torch") is None:
+            self.failure_reason = "PyTorch is required for caption generation but is not installed."
+            logger.warning(self.failure_reason)
+            return
+        if find_spec("transformers") is None:
+            self.failure_reason = (
+                "transformers package is required for captioning but was not found."
+            )
+            logger.warning(self.failure_reason)
+            return
+
         try:
             from transformers import BlipForConditionalGeneration, BlipProcessor
         except ImportError as exc:
@@ -105,35 +141,85 @@ class TaggingSession:
             logger.debug("Caption model load error", exc_info=True)
             return
 
+        quantized = False
+        if config.gallery.tagging_quantize and device.type == "cpu":
+            try:
+                caption_model = torch.ao.quantization.quantize_dynamic(
+                    caption_model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                quantized = True
+            except Exception as exc:  # pragma: no cover - depends on torch build
+                logger.warning("Caption model quantization failed; using float weights: %s", exc)
+
         self._processor = processor
         self._caption_model = caption_model
         self._torch = torch
         self._device = device
         self.available = True
         self.model_signature = f"caption:{config.gallery.caption_model}|tagger:none"
+        if quantized:
+            self.model_signature += "|quant:int8"
         logger.debug(
             "Initialised tagging session with models %s (%s)",
             self.model_signature,
             device,
         )
 
-    def annotate(self, image_path: Path) -> Optional[AnnotationResult]:
-        """Return ML-generated metadata for an image, or None if unavailable."""
-        if not self.available or not self._processor or not self._caption_model:
+    def close(self) -> None:
+        """Release the connection to a resident tagger server, if one is in use."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+            self.available = False
+
+    def preprocess(self, image_path: Path) -> Any | None:
+        """Decode an image into CPU-side model inputs, or None if it cannot be used.
+
+        Safe to call from worker threads: Pillow releases the GIL while decoding,
+        so decoding upcoming images overlaps with caption generation.
+        """
+        if self._client is not None:
+            # The server decodes images itself; hand the path through untouched.
+            return image_path
+        if not self.available or not self._processor:
             return None
 
+        from PIL import Image
+
         try:
             with Image.open(image_path) as base_image:
                 rgb = base_image.convert("RGB")
                 try:
-                    caption = self._generate_caption(rgb)
-                    tag_result = self._derive_tags_from_text(caption or "")
+                    inputs = self._processor(images=rgb, return_tensors="pt")
                 finally:
                     rgb.close()
         except getattr(Image, "DecompressionBombError", Exception) as exc:
             logger.warning("Skipping ML annotation for oversized image %s: %s", image_path, exc)
             return None
 
+        if self._uses_cuda():
+            # Page-locked host memory lets the device copy run asynchronously.
+            inputs["pixel_values"] = inputs["pixel_values"].pin_memory()
+        return inputs
+
+    def annotate(self, image_path: Path, inputs: Any | None = None) -> Optional[AnnotationResult]:
+        """Return ML-generated metadata for an image, or None if unavailable.
+
+        ``inputs`` may carry the result of :meth:`preprocess` computed ahead of time.
+        """
+        if self._client is not None:
+            return cast(Optional[AnnotationResult], self._client.annotate(image_path))
+        if not self.available or not self._processor or not self._caption_model:
+            return None
+
+        if inputs is None:
+            inputs = self.preprocess(image_path)
+            if inputs is None:
+                return None
+
+        caption = self._generate_caption(inputs)
+        tag_result = self._derive_tags_from_text(caption or "")
+
         return AnnotationResult(
             caption=caption,
             alt_text=caption,
@@ -141,16 +227,23 @@ class TaggingSession:
             tag_scores=tag_result["scores"],
         )
 
-    def _generate_caption(self, image: Image.Image) -> str | None:
+    def _generate_caption(self, inputs: Any) -> str | None:
         assert self._processor is not None
         assert self._caption_model is not None
         assert self._torch is not None
         assert self._device is not None
 
-        inputs = self._processor(images=image, return_tensors="pt").to(self._device)
+        model_inputs = dict(inputs)
+        pixel_values = model_inputs.pop("pixel_values")
+        model_inputs = {key: value.to(self._device) for key, value in model_inputs.items()}
+        if self._uses_cuda():
+            pixel_values = self._copy_to_device_buffer(pixel_values)
+        else:
+            pixel_values = pixel_values.to(self._device)
         with self._torch.no_grad():
             output_ids = self._caption_model.generate(
-                **inputs,
+                pixel_values=pixel_values,
+                **model_inputs,
                 max_new_tokens=60,
                 num_beams=5,
                 no_repeat_ngram_size=3,
@@ -162,6 +255,26 @@ class TaggingSession:
         caption = caption.strip()
         return caption or None
 
+    def _uses_cuda(self) -> bool:
+        return self._device is not None and getattr(self._device, "type", None) == "cuda"
+
+    def _copy_to_device_buffer(self, pixel_values: Any) -> Any:
+        """Copy pixel values into a device tensor reused across calls.
+
+        Captioning runs one image at a time on a single stream, so the buffer is
+        free again by the time the next copy is queued.
+        """
+        buffer = self._pixel_buffer
+        if (
+            buffer is None
+            or buffer.shape != pixel_values.shape
+            or buffer.dtype != pixel_values.dtype
+        ):
+            buffer = cast(Any, self._torch).empty_like(pixel_values, device=self._device)
+            self._pixel_buffer = buffer
+        buffer.copy_(pixel_values, non_blocking=True)
+        return buffer
+
     def _derive_tags_from_text(self, text: str) -> TagResult:
         alias_map = _load_alias_map()
         stopwords = _load_stopwords()
@@ -178,7 +291,7 @@ class TaggingSession:
                         if chunk_text:
                             candidates.append(chunk_text)
                     for token in doc:
-                        if token.pos_ in {"PROPN", "NOUN"} and not token.is_stop:
+                        if token.pos_ in _NOUN_POS and not token.is_stop:
                             candidates.append(token.text)
                 except Exception:
                     candidates.extend(_rule_based_terms(cleaned_text))
@@ -187,8 +300,8 @@ class TaggingSession:
 
         def base_key(term: str) -> str:
             lower = term.lower().strip()
-            lower = re.sub(r"[_\-]+", " ", lower)
-            lower = re.sub(r"\s+", " ", lower).strip()
+            lower = _SEPARATOR_PATTERN.sub(" ", lower)
+            lower = _WHITESPACE_PATTERN.sub(" ", lower).strip()
             lower = alias_map.get(lower, lower)
             if lower.endswith("ies") and len(lower) > 3:
                 lower = lower[:-3] + "y"
@@ -303,13 +416,9 @@ def _rule_based_terms(text: str) -> list[str]:
     - Includes non-stopword alphabetic words >= 3 chars
     """
     terms: list[str] = []
-    for m in re.finditer(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b", text):
+    for m in _PROPER_NOUN_PATTERN.finditer(text):
         terms.append(m.group(1))
-    raw_words = re.findall(r"[A-Za-z]{3,}", text)
-    common_stops = {
-        "the","and","for","with","from","that","this","there","their","your","have","has","was","were","are","been","into","over","under","between","within","about","above","below","after","before","during","without","because","while","where","when","which","will","would","could","should","can","may","might"
-    }
-    for w in raw_words:
-        if w.lower() not in common_stops:
+    for w in _WORD_PATTERN.findall(text):
+        if w.lower() not in _COMMON_STOPS:
             terms.append(w)
     return terms
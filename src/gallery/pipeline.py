@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import contextlib
-import json
 import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import chain, islice
 from pathlib import Path, PurePosixPath
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator, Sequence
 
 from ..config import Config
+from ..fileio import dumps_line, list_subdirectories
 from ..media.processor import MediaProcessingResult
 from .inference import TaggingSession, ml_timestamp
 from .llm import clean_metadata
@@ -27,6 +31,10 @@ from .utils import read_json, title_from_stem, write_json
 logger = logging.getLogger(__name__)
 
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".tiff", ".bmp"}
+TAGGING_PREFETCH_WORKERS = 4
+TAGGING_PREFETCH_DEPTH = 8
+# Below this many collections, sidecars load serially unless load_workers is set.
+PARALLEL_LOAD_MIN_COLLECTIONS = 8
 
 
 def prepare_workspace(
@@ -46,6 +54,10 @@ def prepare_workspace(
         return workspace
 
     run_llm = config.gallery.llm_enabled if run_llm_cleanup is None else run_llm_cleanup
+    # Load every sidecar before any model is constructed: the loader may fork worker
+    # processes, which must not inherit torch's threads and OpenMP state.
+    loaded_collections = list(_load_collections(list_subdirectories(root), config))
+
     tagging_session: TaggingSession | None = None
     if auto_generate and config.gallery.tagging_enabled:
         candidate = TaggingSession(config)
@@ -57,12 +69,13 @@ def prepare_workspace(
 
     now = datetime.now(tz=timezone.utc)
 
-    for collection_dir in sorted(p for p in root.iterdir() if p.is_dir()):
-        try:
-            collection = _load_collection(collection_dir, config)
-        except ValueError as exc:
-            workspace.add_error(f"Failed to load collection at {collection_dir}: {exc}")
+    # ML stages below stay in this process because model state is not safe to
+    # share across workers.
+    for collection_dir, loaded in loaded_collections:
+        if isinstance(loaded, str):
+            workspace.add_error(f"Failed to load collection at {collection_dir}: {loaded}")
             continue
+        collection = loaded
 
         workspace.add_collection(collection)
 
@@ -78,11 +91,17 @@ def prepare_workspace(
                     if generate_image_metadata(image_entry, collection, now):
                         image_entry.mark_changed()
             if tagging_session is not None:
-                for image_entry in collection.images:
-                    if image_entry.sidecar_existed and not refresh:
-                        continue
+                pending = [
+                    image_entry
+                    for image_entry in collection.images
+                    if not image_entry.sidecar_existed or refresh
+                ]
+                for image_entry, prepared in _prefetch_tagging_inputs(tagging_session, pending):
                     try:
-                        if _apply_tagging(image_entry, tagging_session, workspace, now):
+                        inputs = prepared.result()
+                        if inputs is None:
+                            continue
+                        if _apply_tagging(image_entry, tagging_session, workspace, now, inputs=inputs):
                             image_entry.mark_changed()
                     except Exception as exc:  # pragma: no cover - defensive logging
                         message = f"Failed to annotate {image_entry.source_path.name}: {exc}"
@@ -96,6 +115,9 @@ def prepare_workspace(
                     if clean_metadata(image_entry, now):
                         image_entry.mark_changed()
 
+    if tagging_session is not None:
+        tagging_session.close()
+
     if auto_generate:
         persist_workspace(workspace, refresh=refresh)
 
@@ -139,6 +161,7 @@ def apply_derivatives(
         return 0
     updated = 0
     variant_map = media_result.variants
+    profile_roles = tuple(config.gallery.profile_map.items())
 
     for image in workspace.iter_images():
         key = f"gallery/{image.collection_id}/{image.metadata.filename}"
@@ -149,9 +172,14 @@ def apply_derivatives(
         original = derived.get("original") or key
         derived["original"] = original
 
+        variants_by_profile: dict[str, Any] = {}
+        for item in variants:
+            # Keep the first variant per profile, matching the previous linear scan.
+            variants_by_profile.setdefault(item.profile, item)
+
         changed = False
-        for role, profile in config.gallery.profile_map.items():
-            variant = next((item for item in variants if item.profile == profile), None)
+        for role, profile in profile_roles:
+            variant = variants_by_profile.get(profile)
             if variant is None:
                 continue
             path = _resolve_variant_path(config, variant.path)
@@ -183,7 +211,7 @@ def export_datasets(workspace: GalleryWorkspace, config: Config) -> None:
         return
     data_root = config.output_dir / config.gallery.data_subdir
     data_root.mkdir(parents=True, exist_ok=True)
-    existing_files = {path for path in data_root.glob("**/*") if path.is_file()}
+    existing_files, existing_dirs = _scan_data_tree(data_root)
     timestamp = datetime.now(tz=timezone.utc).isoformat()
 
     collections_payload: dict[str, Any] = {
@@ -230,15 +258,62 @@ def export_datasets(workspace: GalleryWorkspace, config: Config) -> None:
         with contextlib.suppress(FileNotFoundError):
             leftover.unlink()
 
-    for directory in sorted(
-        (path for path in data_root.glob("**/*") if path.is_dir()),
-        key=lambda item: len(item.parts),
-        reverse=True,
-    ):
+    # Exports only write files at the top level, so the directories found up
+    # front are the only candidates left empty; they are listed deepest first.
+    for directory in existing_dirs:
         with contextlib.suppress(OSError):
             directory.rmdir()
 
 
+def _scan_data_tree(root: Path) -> tuple[set[Path], list[Path]]:
+    """Return files under ``root`` and its subdirectories ordered deepest first."""
+    files: set[Path] = set()
+    directories: list[Path] = []
+    for current, dirnames, filenames in os.walk(root, topdown=False):
+        base = Path(current)
+        files.update(base / name for name in filenames)
+        directories.extend(base / name for name in dirnames)
+    return files, directories
+
+
+def _load_collections(
+    directories: Sequence[Path],
+    config: Config,
+) -> Iterator[tuple[Path, GalleryCollectionEntry | str]]:
+    """Yield loaded collections (or error messages) in directory order."""
+    workers = _load_worker_count(config, len(directories))
+    if workers <= 1:
+        for directory in directories:
+            yield directory, _load_collection_or_error(directory, config)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_load_collection_or_error, directory, config)
+            for directory in directories
+        ]
+        for directory, future in zip(directories, futures):
+            yield directory, future.result()
+
+
+def _load_worker_count(config: Config, pending: int) -> int:
+    requested = config.gallery.load_workers
+    if requested is None:
+        # Starting a pool costs more than reading a handful of sidecars.
+        if pending < PARALLEL_LOAD_MIN_COLLECTIONS:
+            return 1
+        requested = os.cpu_count() or 1
+    return max(1, min(requested, pending))
+
+
+def _load_collection_or_error(directory: Path, config: Config) -> GalleryCollectionEntry | str:
+    # Validation errors are reported as text so results always cross process boundaries.
+    try:
+        return _load_collection(directory, config)
+    except ValueError as exc:
+        return str(exc)
+
+
 def _load_collection(directory: Path, config: Config) -> GalleryCollectionEntry:
     collection_id = directory.name
     sidecar_path = directory / config.gallery.metadata_filename
@@ -316,9 +391,15 @@ def _load_image(path: Path, collection: GalleryCollectionEntry, config: Config)
 
 
 def _iter_images(directory: Path) -> Iterable[Path]:
-    for path in directory.iterdir():
-        if path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS:
-            yield path
+    # DirEntry caches the file type from readdir, avoiding a stat per entry.
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            name = entry.name
+            dot = name.rfind(".")
+            if dot > 0 and name[dot:].lower() in IMAGE_EXTENSIONS:
+                yield Path(entry.path)
 
 
 def _resolve_variant_path(config: Config, relative_path: str) -> str:
@@ -398,7 +479,7 @@ def _write_collection_jsonl(
             )
             payload = record.model_dump(mode="json", exclude_none=True)
             payload.setdefault("generated_at", timestamp)
-            line = json.dumps(payload, ensure_ascii=False)
+            line = dumps_line(payload)
             handle.write(line)
             handle.write("\n")
             lines.append(line)
@@ -410,14 +491,43 @@ def _collection_jsonl_path(collection: GalleryCollectionEntry, data_root: Path)
     return data_root / filename
 
 
+def _prefetch_tagging_inputs(
+    session: TaggingSession,
+    entries: Sequence[GalleryImageEntry],
+) -> Iterator[tuple[GalleryImageEntry, Future[Any]]]:
+    """Yield entries in order alongside futures decoding their model inputs.
+
+    Decoding runs a bounded window ahead of the consumer so image decode overlaps
+    with caption generation without holding every tensor in memory at once.
+    """
+    if not entries:
+        return
+    remaining = iter(entries)
+    window: deque[tuple[GalleryImageEntry, Future[Any]]] = deque()
+    with ThreadPoolExecutor(
+        max_workers=TAGGING_PREFETCH_WORKERS,
+        thread_name_prefix="gallery-preprocess",
+    ) as executor:
+        for entry in islice(remaining, TAGGING_PREFETCH_DEPTH):
+            window.append((entry, executor.submit(session.preprocess, entry.source_path)))
+        while window:
+            current = window.popleft()
+            upcoming = next(remaining, None)
+            if upcoming is not None:
+                window.append((upcoming, executor.submit(session.preprocess, upcoming.source_path)))
+            yield current
+
+
 def _apply_tagging(
     image_entry: GalleryImageEntry,
     session: TaggingSession,
     workspace: GalleryWorkspace,
     now: datetime,
+    *,
+    inputs: Any | None = None,
 ) -> bool:
     """Apply ML-generated annotations to an image metadata payload."""
-    annotation = session.annotate(image_entry.source_path)
+    annotation = session.annotate(image_entry.source_path, inputs=inputs)
     if annotation is None:
         return False
 
@@ -426,9 +536,12 @@ def _apply_tagging(
     source_hash = metadata.hash
 
     def _has_placeholder_tags() -> bool:
-        candidates = list(metadata.tags or []) + list(metadata.tags_raw or [])
-        candidates.extend((metadata.tag_scores or {}).keys())
-        return any(str(tag).upper().startswith("LABEL_") for tag in candidates)
+        candidates = chain(
+            metadata.tags or (),
+            metadata.tags_raw or (),
+            (metadata.tag_scores or {}).keys(),
+        )
+        return any(isinstance(tag, str) and tag[:6].upper() == "LABEL_" for tag in candidates)
 
     if (
         metadata.ml_source_hash
@@ -461,8 +574,10 @@ def _apply_tagging(
     _set_text("caption_raw", annotation.caption)
     _set_text("caption", annotation.caption)
 
+    # The annotation is built fresh per call, so its containers can be adopted
+    # without copying; downstream cleanup reassigns rather than mutates them.
     if annotation.tags:
-        tags = list(annotation.tags)
+        tags = annotation.tags
         if not manual.get("tags_raw") and metadata.tags_raw != tags:
             metadata.tags_raw = tags
             changed = True
@@ -470,7 +585,7 @@ def _apply_tagging(
             metadata.tags = tags
             changed = True
 
-    scores = dict(annotation.tag_scores)
+    scores = annotation.tag_scores
     if metadata.tag_scores != scores:
         metadata.tag_scores = scores
         changed = True
@@ -485,12 +600,13 @@ def _apply_tagging(
         metadata.ml_model_signature = session.model_signature
         changed = True
 
-    timestamp = ml_timestamp()
-    metadata.ml_generated_at = timestamp
-    changed = True
-    if metadata.last_generated_at != now:
-        metadata.last_generated_at = now
+    # Only stamp generation times when the annotation changed something (or was
+    # never recorded); a fresh timestamp alone must not force a sidecar rewrite.
+    if changed or metadata.ml_generated_at is None:
+        metadata.ml_generated_at = ml_timestamp()
         changed = True
+        if metadata.last_generated_at != now:
+            metadata.last_generated_at = now
 
     image_entry.metadata = metadata
     return changed
@@ -0,0 +1,230 @@
+"""Resident captioning server that keeps gallery models loaded between runs."""
+
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+import sys
+import tempfile
+import threading
+from dataclasses import asdict
+from hashlib import sha256
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Callable
+
+from ..config import Config
+from ..media import apply_decompression_bomb_limit
+from .inference import AnnotationResult, TaggingSession
+
+logger = logging.getLogger(__name__)
+
+AUTHKEY_FILENAME = "tagger-server.key"
+SOCKET_FILENAME = "tagger-server.sock"
+# AF_UNIX paths are limited to ~108 bytes; longer cache paths fall back to the temp dir.
+_MAX_SOCKET_PATH = 100
+# The server authenticates clients only when it accepts them, which waits for the
+# current client to finish. Builds fall back to in-process tagging after this long.
+CONNECT_TIMEOUT = 5.0
+
+
+class TaggerServerError(RuntimeError):
+    """Raised when the resident tagger server cannot be started."""
+
+
+class TaggerClient:
+    """Connection to a running tagger server, used in place of local models."""
+
+    def __init__(self, connection: Connection, model_signature: str | None) -> None:
+        self._connection = connection
+        self.model_signature = model_signature
+
+    def annotate(self, image_path: Path) -> AnnotationResult | None:
+        self._connection.send(("annotate", str(image_path.resolve())))
+        status, payload = self._connection.recv()
+        if status != "ok":
+            raise RuntimeError(f"Tagger server error: {payload}")
+        if payload is None:
+            return None
+        return AnnotationResult(**payload)
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def server_address(config: Config) -> str:
+    """Return the socket (or named pipe) address for the configured cache directory."""
+    root = _server_root(config)
+    digest = sha256(str(root.resolve()).encode("utf-8")).hexdigest()[:16]
+    if sys.platform == "win32":
+        return rf"\\.\pipe\smilecms-tagger-{digest}"
+    candidate = root / SOCKET_FILENAME
+    if len(str(candidate)) > _MAX_SOCKET_PATH:
+        candidate = Path(tempfile.gettempdir()) / f"smilecms-tagger-{digest}.sock"
+    return str(candidate)
+
+
+def tagging_settings(config: Config) -> dict[str, object]:
+    """Settings that shape annotations; a client and server must agree on all of them."""
+    gallery = config.gallery
+    return {
+        "caption_model": gallery.caption_model,
+        "max_tags": gallery.tagging_max_tags,
+        "quantize": gallery.tagging_quantize,
+        "device": gallery.tagging_device,
+    }
+
+
+def connect(config: Config) -> TaggerClient | None:
+    """Return a client for a compatible running server, or None when there is none."""
+    connection = _open_connection(config, timeout=CONNECT_TIMEOUT)
+    if connection is None:
+        return None
+    try:
+        connection.send(("hello", tagging_settings(config)))
+        status, payload = connection.recv()
+    except (OSError, EOFError):
+        connection.close()
+        return None
+    if status != "ok":
+        logger.info("Ignoring tagger server: %s", payload)
+        connection.close()
+        return None
+    logger.debug("Using resident tagger server at %s", server_address(config))
+    return TaggerClient(connection, payload)
+
+
+def stop_server(config: Config) -> bool:
+    """Ask a running server to shut down. Returns False when none was reachable."""
+    connection = _open_connection(config)
+    if connection is None:
+        return False
+    with connection:
+        try:
+            connection.send(("shutdown",))
+            connection.recv()
+        except (OSError, EOFError):
+            pass
+    return True
+
+
+def serve(config: Config, *, on_ready: Callable[[str], None] | None = None) -> None:
+    """Load the caption model once and answer annotation requests until shut down.
+
+    Clients are served one at a time, so concurrent builds queue behind each other.
+    """
+    address = server_address(config)
+    existing = _open_connection(config)
+    if existing is not None:
+        existing.close()
+        raise TaggerServerError(f"A tagger server is already listening on {address}.")
+
+    apply_decompression_bomb_limit(config)
+    session = TaggingSession(config, use_server=False)
+    if not session.available:
+        raise TaggerServerError(session.failure_reason or "ML tagging unavailable.")
+
+    authkey = _write_authkey(config)
+    if sys.platform != "win32":
+        # A socket left behind by a crashed server blocks bind().
+        Path(address).unlink(missing_ok=True)
+
+    with Listener(address, authkey=authkey) as listener:
+        if on_ready is not None:
+            on_ready(address)
+        running = True
+        while running:
+            try:
+                connection = listener.accept()
+            except (OSError, AuthenticationError) as exc:
+                logger.warning("Rejected tagger client: %s", exc)
+                continue
+            with connection:
+                running = _handle_client(connection, session, config)
+
+
+def _handle_client(connection: Connection, session: TaggingSession, config: Config) -> bool:
+    """Serve one client until it disconnects. Returns False on a shutdown request."""
+    while True:
+        try:
+            message = connection.recv()
+        except (OSError, EOFError):
+            return True
+        command = message[0]
+        if command == "hello":
+            expected = tagging_settings(config)
+            requested = message[1] if isinstance(message[1], dict) else {}
+            mismatched = [key for key in expected if requested.get(key) != expected[key]]
+            if mismatched:
+                details = ", ".join(f"{key}={expected[key]!r}" for key in mismatched)
+                connection.send(("error", f"server tagging settings differ: {details}"))
+            else:
+                connection.send(("ok", session.model_signature))
+        elif command == "annotate":
+            try:
+                result = session.annotate(Path(message[1]))
+            except Exception as exc:
+                connection.send(("error", str(exc)))
+                continue
+            connection.send(("ok", None if result is None else asdict(result)))
+        elif command == "shutdown":
+            connection.send(("ok", None))
+            return False
+        else:
+            connection.send(("error", f"unknown command {command!r}"))
+
+
+def _server_root(config: Config) -> Path:
+    return (config.cache_dir / "ml").expanduser()
+
+
+def _open_connection(config: Config, *, timeout: float | None = None) -> Connection | None:
+    authkey = _read_authkey(config)
+    if authkey is None:
+        return None
+    address = server_address(config)
+    if sys.platform != "win32" and not Path(address).exists():
+        return None
+    if timeout is None:
+        return _client(address, authkey)
+    # Client() has no timeout of its own, so wait for it from a daemon thread. A
+    # connection that completes after we gave up is closed when it is collected.
+    connections: list[Connection | None] = []
+    thread = threading.Thread(
+        target=lambda: connections.append(_client(address, authkey)), daemon=True
+    )
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        logger.info("Tagger server at %s is busy; tagging in-process instead.", address)
+        return None
+    return connections[0]
+
+
+def _client(address: str, authkey: bytes) -> Connection | None:
+    try:
+        return Client(address, authkey=authkey)
+    except (OSError, EOFError, AuthenticationError):
+        return None
+
+
+def _read_authkey(config: Config) -> bytes | None:
+    try:
+        return (_server_root(config) / AUTHKEY_FILENAME).read_bytes() or None
+    except OSError:
+        return None
+
+
+def _write_authkey(config: Config) -> bytes:
+    root = _server_root(config)
+    root.mkdir(parents=True, exist_ok=True)
+    path = root / AUTHKEY_FILENAME
+    authkey = secrets.token_bytes(32)
+    path.unlink(missing_ok=True)
+    # Requests are pickled, so only clients that can read this key may connect.
+    descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(descriptor, "wb") as handle:
+        handle.write(authkey)
+    return authkey
@@ -9,6 +9,8 @@ from hashlib import sha256
 from pathlib import Path
 from typing import Any, Iterable, Sequence
 
+from ..fileio import orjson
+
 
 SLUG_PATTERN = re.compile(r"[^a-z0-9\-]+")
 WHITESPACE_PATTERN = re.compile(r"\s+")
@@ -47,20 +49,31 @@ def hash_file(path: Path, block_size: int = 1024 * 1024) -> str:
 
 
 def read_json(path: Path) -> dict[str, Any]:
-    if not path.exists():
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
         return {}
-    with path.open("r", encoding="utf-8") as handle:
-        try:
-            data = json.load(handle)
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Invalid JSON in {path}: {exc}") from exc
+    try:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Invalid JSON in {path}: {exc}") from exc
     if not isinstance(data, dict):
         raise ValueError(f"Expected mapping at {path}, received {type(data).__name__}")
     return data
 
 
 def write_json(path: Path, payload: dict[str, Any]) -> None:
+    """Write ``payload`` as indented, key-sorted JSON.
+
+    Layout matches between backends, but float spelling does not: json writes
+    ``1e-05`` where orjson writes ``0.00001``. Both parse back to the same value.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        path.write_bytes(orjson.dumps(payload, option=options))
+        return
     with path.open("w", encoding="utf-8") as handle:
         json.dump(payload, handle, ensure_ascii=False, indent=2, sort_keys=True)
         handle.write("\n")
@@ -18,6 +18,9 @@ class JsValidatorUnavailableError(JsValidatorError):
     """Raised when JavaScript validation cannot run due to missing tooling."""
 
 
+_NODE_PROBE_TIMEOUT = 2.0
+
+
 @dataclass(slots=True)
 class JsValidationIssue:
     """Represents a problem detected while parsing JavaScript."""
@@ -125,8 +128,9 @@ def _node_available() -> tuple[str, Tuple[int, int, int]] | None:
             capture_output=True,
             text=True,
             check=False,
+            timeout=_NODE_PROBE_TIMEOUT,
         )
-    except OSError:
+    except (OSError, subprocess.TimeoutExpired):
         return None
 
     version_text = (result.stdout or result.stderr or "").strip()
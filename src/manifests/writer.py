@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Iterable
 
@@ -17,8 +16,8 @@ def write_manifest_pages(pages: Iterable[ManifestPage], destination: Path) -> li
 
     for page in pages:
         path = destination / f"{page.id}.json"
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(page.model_dump(mode="json"), handle, ensure_ascii=False, indent=2)
+        # pydantic's native serializer skips the intermediate dict and pure-Python indenting.
+        path.write_bytes(page.model_dump_json(indent=2).encode("utf-8"))
         written.append(path)
         if path in existing_files:
             existing_files.remove(path)
@@ -3,7 +3,15 @@
 from .audit import MediaAuditResult, audit_media
 from .models import MediaDerivativeTask, MediaPlan
 from .pipeline import collect_media_plan
-from .processor import MediaProcessingResult, apply_variants_to_documents, process_media_plan
+from .processor import (
+    MediaProcessingResult,
+    apply_decompression_bomb_limit,
+    apply_variants_to_documents,
+    create_media_executor,
+    load_media_result,
+    process_media_plan,
+    save_media_result,
+)
 
 __all__ = [
     "MediaAuditResult",
@@ -13,5 +21,9 @@ __all__ = [
     "collect_media_plan",
     "MediaProcessingResult",
     "process_media_plan",
+    "load_media_result",
+    "save_media_result",
     "apply_variants_to_documents",
+    "apply_decompression_bomb_limit",
+    "create_media_executor",
 ]
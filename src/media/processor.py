@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
 import shutil
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterable, Set, Any, Union, cast, Callable
@@ -14,7 +19,8 @@ from PIL import Image, ImageDraw, ImageFont
 
 from ..config import Config, DerivativeProfile, MediaMetadataEmbedConfig, MediaWatermarkConfig
 from ..content import ContentDocument, MediaReference, MediaVariant
-from .models import MediaPlan
+from ..fileio import write_bytes_atomic
+from .models import MediaDerivativeTask, MediaPlan
 
 logger = logging.getLogger(__name__)
 
@@ -64,16 +70,22 @@ def process_media_plan(
     config: Config,
     *,
     on_progress: Callable[[str], None] | None = None,
+    executor: Executor | None = None,
 ) -> MediaProcessingResult:
     """Execute derivative tasks and return processing details.
 
     When provided, ``on_progress`` is called with either "derivative" or "asset"
     after handling each corresponding unit of work. This enables callers (e.g.,
     the CLI) to display progress without changing core logic or results.
+
+    Derivatives that need rendering are submitted to ``executor`` when one is
+    given; it must come from ``create_media_executor``, whose workers already hold
+    ``config``. Otherwise they render serially.
     """
     result = MediaProcessingResult()
     derived_root = config.media_processing.output_dir
     expected_files: Set[Path] = set()
+    rendering: list[tuple[MediaDerivativeTask, Future[MediaVariant]]] = []
 
     for task in plan.tasks:
         source = task.source
@@ -105,27 +117,32 @@ def process_media_plan(
                 on_progress("derivative")
             continue
 
-        try:
-            variant = _process_image(source, destination, task.profile, config)
-        except Exception as exc:
-            try:
-                bomb_error = getattr(Image, "DecompressionBombError")
-            except Exception:
-                bomb_error = Exception  # fallback; won't match below if missing
-            if isinstance(exc, bomb_error):
-                message = f"Oversized image skipped due to limit: {source} ({exc})"
-                logger.warning(message)
-                result.warnings.append(message)
-                result.skipped_tasks += 1
-                continue
-            raise
-
-        variant.path = _relative_variant_path(destination, derived_root)
-        result.add_task_variant(task.media_path, variant)
-        expected_files.add(destination.resolve())
-        if on_progress is not None:
+        if executor is not None:
+            rendering.append(
+                (task, executor.submit(_render_in_worker, source, destination, task.profile))
+            )
+            continue
+
+        rendered = _record_rendered(
+            result,
+            task,
+            lambda: _process_image(source, destination, task.profile, config),
+            derived_root,
+            expected_files,
+        )
+        if rendered and on_progress is not None:
             on_progress("derivative")
 
+    if rendering:
+        if on_progress is not None:
+            # Match the serial path: images skipped as oversized report no progress.
+            for future in as_completed(future for _, future in rendering):
+                if future.exception() is None:
+                    on_progress("derivative")
+        # Record in plan order so variant ordering does not depend on worker timing.
+        for task, future in rendering:
+            _record_rendered(result, task, future.result, derived_root, expected_files)
+
     for rel_path, source in plan.static_assets.items():
         destination = derived_root / rel_path
         if not source.exists():
@@ -187,6 +204,78 @@ def _is_image(path: Path) -> bool:
     return path.suffix.lower() in {".jpg", ".jpeg", ".png", ".webp", ".gif", ".tiff", ".bmp"}
 
 
+def apply_decompression_bomb_limit(config: Config) -> None:
+    """Apply ``media_processing.decompression_bomb_limit`` to Pillow, if configured.
+
+    Useful when processing ultra-high-resolution assets in a trusted context.
+    """
+    limit = config.media_processing.decompression_bomb_limit
+    if limit is not None:
+        Image.MAX_IMAGE_PIXELS = None if limit <= 0 else limit
+
+
+def create_media_executor(config: Config) -> Executor | None:
+    """Return a process pool for rendering derivatives, or None to render serially."""
+    workers = config.media_processing.workers or os.cpu_count() or 1
+    if workers <= 1:
+        return None
+    # Spawn rather than fork: the pool is created while rich's progress thread
+    # (and possibly torch) is live in the parent. Spawned workers start clean, so
+    # the config and the decompression bomb override are shipped once here.
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_media_worker,
+        initargs=(config, Image.MAX_IMAGE_PIXELS),
+    )
+
+
+_worker_config: Config | None = None
+
+
+def _init_media_worker(config: Config, max_image_pixels: int | None) -> None:
+    global _worker_config
+    _worker_config = config
+    Image.MAX_IMAGE_PIXELS = max_image_pixels
+
+
+def _render_in_worker(source: Path, destination: Path, profile: DerivativeProfile) -> MediaVariant:
+    if _worker_config is None:
+        raise RuntimeError("Media worker was not initialised; use create_media_executor().")
+    return _process_image(source, destination, profile, _worker_config)
+
+
+def _record_rendered(
+    result: MediaProcessingResult,
+    task: MediaDerivativeTask,
+    render: Callable[[], MediaVariant],
+    derived_root: Path,
+    expected_files: Set[Path],
+) -> bool:
+    """Add the variant produced by ``render``; returns False when the image was skipped."""
+    source = task.source
+    destination = task.destination
+    try:
+        variant = render()
+    except Exception as exc:
+        try:
+            bomb_error = getattr(Image, "DecompressionBombError")
+        except Exception:
+            bomb_error = Exception  # fallback; won't match below if missing
+        if isinstance(exc, bomb_error):
+            message = f"Oversized image skipped due to limit: {source} ({exc})"
+            logger.warning(message)
+            result.warnings.append(message)
+            result.skipped_tasks += 1
+            return False
+        raise
+
+    variant.path = _relative_variant_path(destination, derived_root)
+    result.add_task_variant(task.media_path, variant)
+    expected_files.add(destination.resolve())
+    return True
+
+
 def _process_image(
     source: Path, destination: Path, profile: DerivativeProfile, config: Config
 ) -> MediaVariant:
@@ -242,6 +331,70 @@ def _process_image(
     )
 
 
+def save_media_result(result: MediaProcessingResult, plan: MediaPlan, path: Path) -> None:
+    """Persist ``result`` so an unchanged rebuild can skip ``process_media_plan``."""
+    payload = {
+        "plan": _plan_signature(plan),
+        "variants": {
+            media_path: [variant.model_dump() for variant in variants]
+            for media_path, variants in result.variants.items()
+        },
+        "skipped_tasks": result.skipped_tasks,
+        "warnings": result.warnings,
+        "missing_sources": result.missing_sources,
+        "unsupported_media": result.unsupported_media,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_bytes_atomic(path, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+
+def load_media_result(plan: MediaPlan, config: Config, path: Path) -> MediaProcessingResult | None:
+    """Return the persisted result for ``plan``, or None when it cannot be trusted.
+
+    Callers are responsible for checking that the media inputs are unchanged; this
+    only verifies that the plan matches and every derivative is still on disk.
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if payload.get("plan") != _plan_signature(plan):
+        return None
+
+    derived_root = config.media_processing.output_dir
+    result = MediaProcessingResult(
+        skipped_tasks=int(payload.get("skipped_tasks") or 0),
+        warnings=list(payload.get("warnings") or []),
+        missing_sources=list(payload.get("missing_sources") or []),
+        unsupported_media=list(payload.get("unsupported_media") or []),
+    )
+    try:
+        for media_path, entries in dict(payload.get("variants") or {}).items():
+            variants = [MediaVariant.model_validate(entry) for entry in entries]
+            for variant in variants:
+                if not (derived_root / variant.path).is_file():
+                    return None
+            result.variants[media_path] = variants
+            if media_path in plan.static_assets:
+                result.reused_assets += 1
+            result.reused_tasks += sum(1 for variant in variants if variant.profile != "original")
+    except (TypeError, ValueError):
+        return None
+    return result
+
+
+def _plan_signature(plan: MediaPlan) -> str:
+    hasher = hashlib.sha256()
+    for task in sorted(plan.tasks, key=lambda item: item.destination.as_posix()):
+        hasher.update(task.media_path.encode("utf-8"))
+        hasher.update(task.destination.as_posix().encode("utf-8"))
+        hasher.update(task.profile.model_dump_json().encode("utf-8"))
+    for rel_path, source in sorted(plan.static_assets.items()):
+        hasher.update(rel_path.encode("utf-8"))
+        hasher.update(source.as_posix().encode("utf-8"))
+    return hasher.hexdigest()
+
+
 def _is_cached(source: Path, destination: Path) -> bool:
     if not destination.exists():
         return False
@@ -274,28 +427,25 @@ def _relative_variant_path(destination: Path, derived_root: Path) -> str:
 
 
 def _prune_stale_artifacts(root: Path, keep: Set[Path]) -> int:
+    """Delete files under ``root`` not listed in ``keep`` (already resolved paths)."""
     if not root.exists():
         return 0
 
-    keep_resolved = {path.resolve() for path in keep}
+    keep_names = {str(path) for path in keep}
+    root_name = str(root.resolve())
     removed = 0
 
-    for existing in root.rglob("*"):
-        existing_resolved = existing.resolve()
-        if existing.is_file() and existing_resolved not in keep_resolved:
-            with contextlib.suppress(FileNotFoundError):
-                existing.unlink()
-                removed += 1
-
-    # Clean up empty directories from leaf to root.
-    directories = sorted(
-        (path for path in root.rglob("*") if path.is_dir()),
-        key=lambda item: len(item.parts),
-        reverse=True,
-    )
-    for directory in directories:
-        with contextlib.suppress(OSError):
-            directory.rmdir()
+    # One bottom-up walk: files go first, then each directory once it may be empty.
+    for current, _dirs, files in os.walk(root_name, topdown=False):
+        for name in files:
+            candidate = os.path.join(current, name)
+            if candidate not in keep_names:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(candidate)
+                    removed += 1
+        if current != root_name:
+            with contextlib.suppress(OSError):
+                os.rmdir(current)
 
     return removed
 
@@ -16,6 +16,7 @@ from ..content import (
     MediaReference,
     MediaVariant,
 )
+from ..fileio import dumps_line
 
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
 VIDEO_EXTENSIONS = {".mp4", ".mov", ".webm", ".mkv"}
@@ -57,7 +58,7 @@ def export_music_catalog(documents: Iterable[ContentDocument], config: Config) -
     jsonl_path = data_root / "tracks.jsonl"
     with jsonl_path.open("w", encoding="utf-8") as handle:
         for record in records:
-            handle.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            handle.write(dumps_line(record))
             handle.write("\n")
 
     summary_path = data_root / "tracks.json"
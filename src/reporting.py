@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable
@@ -74,9 +73,11 @@ def build_document_stats(documents: Iterable[ContentDocument]) -> DocumentStats:
 
 
 def build_manifest_stats(pages: Iterable[ManifestPage]) -> ManifestStats:
-    pages_list = list(pages)
-    total_items = sum(len(page.items) for page in pages_list)
-    return ManifestStats(pages=len(pages_list), items=total_items)
+    page_count = total_items = 0
+    for page in pages:
+        page_count += 1
+        total_items += len(page.items)
+    return ManifestStats(pages=page_count, items=total_items)
 
 
 def build_media_stats(plan: MediaPlan, result: MediaProcessingResult) -> MediaStats:
@@ -105,13 +106,11 @@ def assemble_report(
     manifests: ManifestStats,
     media: MediaStats,
 ) -> BuildReport:
-    warnings: list[str] = []
-    for message in media.warnings:
-        warnings.append(message)
-    for path in media.missing_sources:
-        warnings.append(f"Missing media source: {path}")
-    for path in media.unsupported_media:
-        warnings.append(f"Unsupported media type: {path}")
+    warnings = [
+        *media.warnings,
+        *(f"Missing media source: {path}" for path in media.missing_sources),
+        *(f"Unsupported media type: {path}" for path in media.unsupported_media),
+    ]
 
     return BuildReport(
         project=project,
@@ -127,6 +126,6 @@ def assemble_report(
 def write_report(report: BuildReport, output_dir: Path) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
     target = output_dir / "build-report.json"
-    with target.open("w", encoding="utf-8") as handle:
-        json.dump(report.model_dump(mode="json"), handle, ensure_ascii=False, indent=2)
+    # pydantic's native serializer skips the intermediate dict and pure-Python indenting.
+    target.write_bytes(report.model_dump_json(indent=2).encode("utf-8"))
     return target
@@ -9,10 +9,14 @@ from pathlib import Path
 from typing import Dict, Iterable, Mapping, Sequence
 
 from .config import Config
+from .fileio import write_bytes_atomic
 
 
 STATE_FILENAME = "build-state.json"
 STATE_VERSION = 1
+# Fingerprints that can change media derivatives: the mounts media sources resolve
+# against, plus config values (profiles, watermarking, output paths).
+MEDIA_INPUT_KEYS = frozenset({"config_values", "article_media_dir", "gallery_dir", "music_dir"})
 
 
 @dataclass
@@ -50,10 +54,9 @@ class BuildState:
 
     def save(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            json.dumps(self.to_dict(), ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        # An interrupted build must never leave a truncated state file behind.
+        payload = json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        write_bytes_atomic(path, payload.encode("utf-8"))
 
 
 @dataclass
@@ -67,6 +70,10 @@ class ChangeSummary:
     def has_changes(self) -> bool:
         return bool(self.changed_keys) or self.first_run
 
+    def touches(self, keys: Iterable[str]) -> bool:
+        """Return True when any of ``keys`` may have changed since the last build."""
+        return self.first_run or not self.changed_keys.isdisjoint(keys)
+
 
 class BuildTracker:
     """Compute and persist build fingerprints for incremental rebuilds."""
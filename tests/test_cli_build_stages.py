@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.cli import _gallery_music_outputs_overlap
+from src.config import Config, GalleryConfig, MusicConfig
+
+
+@pytest.mark.parametrize(
+    ("gallery_subdir", "music_subdir", "expected"),
+    [
+        ("data/gallery", "data/music", False),
+        ("data", "data/music", True),
+        ("data/shared", "data/shared", True),
+        ("data/gallery", "gallery/tracks", True),
+        ("data/gallery", "data/gallery/../music", False),
+    ],
+)
+def test_gallery_music_outputs_overlap(
+    tmp_path: Path, gallery_subdir: str, music_subdir: str, expected: bool
+) -> None:
+    config = Config(
+        output_dir=tmp_path / "site",
+        gallery=GalleryConfig(data_subdir=gallery_subdir),
+        music=MusicConfig(data_subdir=music_subdir),
+    )
+
+    assert _gallery_music_outputs_overlap(config) is expected
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from src.cli import app
+
+
+def test_clean_removes_nested_targets_and_cache(tmp_path: Path) -> None:
+    (tmp_path / "smilecms.yml").write_text(
+        (
+            "project_name: Test\n"
+            "output_dir: site\n"
+            "cache_dir: .cache\n"
+            "media_processing:\n"
+            "  output_dir: site/media/derived\n"
+        ),
+        encoding="utf-8",
+    )
+    derived = tmp_path / "site" / "media" / "derived" / "thumb.webp"
+    derived.parent.mkdir(parents=True)
+    derived.write_bytes(b"data")
+    (tmp_path / ".cache" / "ml").mkdir(parents=True)
+
+    result = CliRunner().invoke(
+        app, ["clean", "--config", str(tmp_path / "smilecms.yml"), "--cache"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "removed 3 directories" in result.output
+    assert not (tmp_path / "site").exists()
+    assert not (tmp_path / ".cache").exists()
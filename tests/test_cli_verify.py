@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from src.cli import app
+
+
+def _write_site(project: Path) -> None:
+    (project / "smilecms.yml").write_text(
+        "project_name: Test\noutput_dir: site\n",
+        encoding="utf-8",
+    )
+    site = project / "site"
+    site.mkdir(parents=True)
+    (site / "index.html").write_text(
+        '<html><body><a href="missing.html">Missing</a></body></html>',
+        encoding="utf-8",
+    )
+
+
+def test_verify_writes_report_file(tmp_path: Path) -> None:
+    project = tmp_path / "proj"
+    project.mkdir()
+    _write_site(project)
+    report_path = tmp_path / "reports" / "verify.txt"
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "verify",
+            "--project",
+            str(project),
+            "--no-html-validation",
+            "--no-js-validation",
+            "--report",
+            str(report_path),
+        ],
+    )
+
+    assert report_path.exists(), result.output
+    text = report_path.read_text(encoding="utf-8")
+    assert text.startswith("SmileCMS site verification report")
+    assert "missing.html" in text
+    assert not report_path.with_name("verify.txt.tmp").exists()
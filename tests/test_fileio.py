@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src import fileio
+from src.fileio import write_bytes_atomic
+
+
+def test_write_bytes_atomic_replaces_existing_file(tmp_path: Path) -> None:
+    target = tmp_path / "state.json"
+    target.write_bytes(b"old")
+
+    write_bytes_atomic(target, b"new")
+
+    assert target.read_bytes() == b"new"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_write_bytes_atomic_removes_temp_file_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "state.json"
+    target.write_bytes(b"old")
+
+    def fail_replace(src: os.PathLike[str], dst: os.PathLike[str]) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(fileio.os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        write_bytes_atomic(target, b"new")
+
+    assert target.read_bytes() == b"old"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["state.json"]
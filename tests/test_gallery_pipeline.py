@@ -13,6 +13,8 @@ from src.config import (
     MusicConfig,
 )
 from src.gallery import apply_derivatives, export_datasets, prepare_workspace
+from src.gallery.pipeline import _load_worker_count, _prefetch_tagging_inputs
+from src.gallery.utils import read_json, write_json
 from src.ingest import load_documents
 from src.media import apply_variants_to_documents, collect_media_plan, process_media_plan
 
@@ -94,3 +96,88 @@ def test_gallery_pipeline_generates_sidecars_and_datasets(tmp_path: Path) -> Non
     assert record["id"] == "sunset"
     assert record["collection_id"] == "vacation-trip"
     assert record["thumbnail"]
+
+
+def test_prepare_workspace_loads_collections_in_parallel(tmp_path: Path) -> None:
+    source_root = tmp_path / "media" / "image_gallery_raw"
+    for name in ("beta-set", "alpha-set"):
+        collection_dir = source_root / name
+        collection_dir.mkdir(parents=True, exist_ok=True)
+        Image.new("RGB", (32, 32), color="blue").save(collection_dir / "frame.png")
+    broken_dir = source_root / "broken-set"
+    broken_dir.mkdir(parents=True, exist_ok=True)
+    (broken_dir / "collection.json").write_text(json.dumps({"title": ""}), encoding="utf-8")
+
+    config = Config(
+        gallery=GalleryConfig(
+            source_dir=source_root,
+            tagging_enabled=False,
+            llm_enabled=False,
+            load_workers=2,
+        ),
+    )
+
+    workspace = prepare_workspace(config, auto_generate=False)
+
+    assert list(workspace.collections) == ["alpha-set", "beta-set"]
+    assert workspace.image_count() == 2
+    assert len(workspace.errors) == 1
+    assert "broken-set" in workspace.errors[0]
+
+
+def test_prefetch_tagging_inputs_preserves_order(tmp_path: Path) -> None:
+    class _Session:
+        def preprocess(self, path: Path) -> str:
+            return path.name
+
+    class _Entry:
+        def __init__(self, name: str) -> None:
+            self.source_path = tmp_path / name
+
+    entries = [_Entry(f"{index:02d}.png") for index in range(20)]
+    results = [
+        (entry, future.result())
+        for entry, future in _prefetch_tagging_inputs(_Session(), entries)  # type: ignore[arg-type]
+    ]
+
+    assert [entry for entry, _ in results] == entries
+    assert [name for _, name in results] == [f"{index:02d}.png" for index in range(20)]
+
+
+def test_export_datasets_prunes_stale_nested_outputs(tmp_path: Path) -> None:
+    source_root = tmp_path / "media" / "image_gallery_raw"
+    source_root.mkdir(parents=True)
+    config = Config(
+        output_dir=tmp_path / "site",
+        gallery=GalleryConfig(source_dir=source_root, tagging_enabled=False, llm_enabled=False),
+    )
+    data_root = config.output_dir / config.gallery.data_subdir
+    stale = data_root / "old" / "nested" / "stale.jsonl"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("{}\n", encoding="utf-8")
+
+    export_datasets(prepare_workspace(config), config)
+
+    assert not (data_root / "old").exists()
+    assert (data_root / "manifest.json").exists()
+
+
+def test_load_worker_count_stays_serial_for_small_galleries() -> None:
+    auto = Config(gallery=GalleryConfig(tagging_enabled=False))
+    explicit = Config(gallery=GalleryConfig(tagging_enabled=False, load_workers=2))
+
+    assert _load_worker_count(auto, 3) == 1
+    assert _load_worker_count(explicit, 3) == 2
+    assert _load_worker_count(explicit, 1) == 1
+
+
+def test_write_json_round_trips_extreme_floats(tmp_path: Path) -> None:
+    payload = {"tag_scores": {"tiny": 1e-05, "huge": 1e16, "plain": 0.55}, "ai_confidence": 0.1}
+    path = tmp_path / "sidecar.json"
+
+    write_json(path, payload)
+
+    assert read_json(path) == payload
+    text = path.read_text(encoding="utf-8")
+    assert text.endswith("}\n")
+    assert text.index('"ai_confidence"') < text.index('"tag_scores"')
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+from multiprocessing.connection import Listener
+from pathlib import Path
+
+import pytest
+
+from src.config import Config, GalleryConfig
+from src.gallery import tagger_server
+from src.gallery.inference import AnnotationResult, TaggingSession
+
+
+class _FakeSession:
+    available = True
+    failure_reason = None
+    model_signature = "caption:fake|tagger:none"
+
+    def __init__(self, config: Config, *, use_server: bool = True) -> None:
+        assert use_server is False
+
+    def annotate(self, image_path: Path) -> AnnotationResult:
+        return AnnotationResult(
+            caption=f"a photo of {image_path.stem}",
+            alt_text=image_path.stem,
+            tags=[image_path.stem],
+            tag_scores={image_path.stem: 1.0},
+        )
+
+
+def _config(tmp_path: Path) -> Config:
+    return Config(
+        cache_dir=tmp_path / "cache",
+        gallery=GalleryConfig(source_dir=tmp_path / "gallery", caption_model="fake"),
+    )
+
+
+def _start_server(config: Config) -> threading.Thread:
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=tagger_server.serve,
+        args=(config,),
+        kwargs={"on_ready": lambda _address: ready.set()},
+        daemon=True,
+    )
+    thread.start()
+    assert ready.wait(timeout=10)
+    return thread
+
+
+@pytest.mark.skipif(not hasattr(__import__("socket"), "AF_UNIX"), reason="requires AF_UNIX")
+def test_tagging_session_uses_running_server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tagger_server, "TaggingSession", _FakeSession)
+    config = _config(tmp_path)
+    thread = _start_server(config)
+
+    session = TaggingSession(config)
+    assert session.available
+    assert session.model_signature == "caption:fake|tagger:none"
+    image = tmp_path / "sunset.png"
+    assert session.preprocess(image) == image
+    result = session.annotate(image)
+    assert result is not None
+    assert result.caption == "a photo of sunset"
+    assert result.tags == ["sunset"]
+    session.close()
+
+    assert tagger_server.stop_server(config)
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    deadline = time.monotonic() + 5
+    while Path(tagger_server.server_address(config)).exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not tagger_server.stop_server(config)
+
+
+@pytest.mark.skipif(not hasattr(__import__("socket"), "AF_UNIX"), reason="requires AF_UNIX")
+def test_connect_rejects_server_with_different_tagging_settings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tagger_server, "TaggingSession", _FakeSession)
+    config = _config(tmp_path)
+    thread = _start_server(config)
+
+    for field, value in (("tagging_max_tags", 3), ("tagging_quantize", True)):
+        client_config = config.model_copy(
+            update={"gallery": config.gallery.model_copy(update={field: value})}
+        )
+        assert tagger_server.connect(client_config) is None
+
+    client = tagger_server.connect(config)
+    assert client is not None
+    client.close()
+    assert tagger_server.stop_server(config)
+    thread.join(timeout=10)
+
+
+@pytest.mark.skipif(not hasattr(__import__("socket"), "AF_UNIX"), reason="requires AF_UNIX")
+def test_connect_gives_up_when_server_is_busy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tagger_server, "CONNECT_TIMEOUT", 0.2)
+    config = _config(tmp_path)
+    authkey = tagger_server._write_authkey(config)
+    # A listener that never accepts stands in for a server busy with another build.
+    with Listener(tagger_server.server_address(config), authkey=authkey):
+        started = time.monotonic()
+        assert tagger_server.connect(config) is None
+        assert time.monotonic() - started < 5
+
+
+def test_connect_returns_none_without_server(tmp_path: Path) -> None:
+    config = _config(tmp_path)
+    assert tagger_server.connect(config) is None
+    assert not tagger_server.stop_server(config)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+from typer.testing import CliRunner
+
+from src.cli import app
 from src.config import Config, GalleryConfig, MediaProcessingConfig, MusicConfig
 from src.content.models import ContentDocument, ContentMeta, ContentStatus, MediaReference
 from src.media.audit import audit_media
@@ -94,3 +98,36 @@ def test_audit_media_surfaces_missing_orphan_and_out_of_bounds(tmp_path: Path) -
     assert stray_asset.resolve() in stray_sources
 
     assert result.valid_references == 1
+
+
+def test_audit_media_cli_emits_plain_json(tmp_path: Path) -> None:
+    project = tmp_path / "proj"
+    (project / "content").mkdir(parents=True)
+    (project / "smilecms.yml").write_text(
+        "project_name: Test\ngallery:\n  enabled: false\nmusic:\n  enabled: false\n",
+        encoding="utf-8",
+    )
+
+    result = CliRunner().invoke(app, ["audit", "media", "--project", str(project), "--json"])
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    assert isinstance(payload, dict)
+
+
+def test_audit_media_cli_json_keeps_non_ascii_paths(tmp_path: Path) -> None:
+    project = tmp_path / "proj"
+    (project / "content" / "media").mkdir(parents=True)
+    (project / "content" / "media" / "café.jpg").write_bytes(b"orphan")
+    (project / "smilecms.yml").write_text(
+        "project_name: Test\ngallery:\n  enabled: false\nmusic:\n  enabled: false\n",
+        encoding="utf-8",
+    )
+
+    result = CliRunner().invoke(app, ["audit", "media", "--project", str(project), "--json"])
+
+    assert result.exit_code == 0, result.output
+    assert "café.jpg" in result.stdout
+    assert "\\u00e9" not in result.stdout
+    payload = json.loads(result.stdout)
+    assert any("café.jpg" in json.dumps(item, ensure_ascii=False) for item in payload["orphan_assets"])
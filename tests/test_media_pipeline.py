@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 from PIL import Image
 
 from src.config import (
@@ -11,7 +12,15 @@ from src.config import (
     MediaProcessingConfig,
 )
 from src.content.models import ContentDocument, ContentMeta, ContentStatus, MediaReference
-from src.media import apply_variants_to_documents, collect_media_plan, process_media_plan
+from src.media import (
+    apply_decompression_bomb_limit,
+    apply_variants_to_documents,
+    collect_media_plan,
+    create_media_executor,
+    load_media_result,
+    process_media_plan,
+    save_media_result,
+)
 
 
 def _doc(slug: str, media_paths: list[str], hero_path: str | None = None) -> ContentDocument:
@@ -178,3 +187,136 @@ def test_process_media_plan_copies_static_assets(tmp_path: Path) -> None:
     assert hero.variants
     assert hero.variants[0].profile == "original"
     assert hero.variants[0].path == "gallery/song.mp3"
+
+
+def test_process_media_plan_prunes_stale_derivatives(tmp_path: Path) -> None:
+    raw_dir = tmp_path / "raw"
+    derived_dir = tmp_path / "derived"
+    (raw_dir / "gallery").mkdir(parents=True, exist_ok=True)
+    (raw_dir / "gallery" / "song.mp3").write_bytes(b"ID3test data")
+    stale = derived_dir / "thumb" / "old" / "removed.webp"
+    stale.parent.mkdir(parents=True)
+    stale.write_bytes(b"stale")
+
+    config = Config(
+        media_processing=MediaProcessingConfig(
+            source_dir=raw_dir,
+            output_dir=derived_dir,
+            profiles=[DerivativeProfile(name="thumb", width=160, height=160, format="webp")],
+        ),
+        gallery=GalleryConfig(source_dir=raw_dir / "gallery"),
+    )
+    docs = [_doc("alpha", ["gallery/song.mp3"])]
+
+    result = process_media_plan(collect_media_plan(docs, config), config)
+
+    assert result.pruned_artifacts == 1
+    assert not (derived_dir / "thumb").exists()
+    assert (derived_dir / "gallery" / "song.mp3").exists()
+
+
+def test_load_media_result_reuses_saved_variants(tmp_path: Path) -> None:
+    raw_dir = tmp_path / "raw"
+    (raw_dir / "gallery").mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", (320, 240), color="green").save(raw_dir / "gallery" / "photo.png")
+    (raw_dir / "gallery" / "song.mp3").write_bytes(b"ID3test data")
+    config = Config(
+        media_processing=MediaProcessingConfig(
+            source_dir=raw_dir,
+            output_dir=tmp_path / "derived",
+            profiles=[DerivativeProfile(name="thumb", width=160, height=160, format="webp")],
+        ),
+        gallery=GalleryConfig(source_dir=raw_dir / "gallery"),
+    )
+    plan = collect_media_plan([_doc("alpha", ["gallery/photo.png", "gallery/song.mp3"])], config)
+    result = process_media_plan(plan, config)
+    cache_path = tmp_path / "cache" / "media-result.json"
+    save_media_result(result, plan, cache_path)
+
+    reused = load_media_result(plan, config, cache_path)
+
+    assert reused is not None
+    assert reused.variants == result.variants
+    assert (reused.reused_tasks, reused.reused_assets, reused.processed_tasks) == (1, 1, 0)
+
+    other_plan = collect_media_plan([_doc("alpha", ["gallery/photo.png"])], config)
+    assert load_media_result(other_plan, config, cache_path) is None
+    (tmp_path / "derived" / "thumb" / "gallery" / "photo.webp").unlink()
+    assert load_media_result(plan, config, cache_path) is None
+
+
+def test_process_media_plan_renders_with_executor(tmp_path: Path) -> None:
+    raw_dir = tmp_path / "raw"
+    (raw_dir / "gallery").mkdir(parents=True, exist_ok=True)
+    for index in range(3):
+        Image.new("RGB", (400, 300), color="red").save(raw_dir / "gallery" / f"photo-{index}.png")
+    config = Config(
+        media_processing=MediaProcessingConfig(
+            source_dir=raw_dir,
+            output_dir=tmp_path / "derived",
+            profiles=[
+                DerivativeProfile(name="thumb", width=160, height=160, format="webp", quality=70),
+                DerivativeProfile(name="large", width=320, format="jpg", quality=85),
+            ],
+            workers=2,
+        ),
+        gallery=GalleryConfig(source_dir=raw_dir / "gallery"),
+    )
+    docs = [_doc("alpha", [f"gallery/photo-{index}.png" for index in range(3)])]
+    plan = collect_media_plan(docs, config)
+    progress: list[str] = []
+
+    executor = create_media_executor(config)
+    assert executor is not None
+    with executor:
+        result = process_media_plan(plan, config, on_progress=progress.append, executor=executor)
+
+    assert result.processed_tasks == 6
+    assert progress == ["derivative"] * 6
+    assert [variant.profile for variant in result.variants["gallery/photo-1.png"]] == ["thumb", "large"]
+    assert result.variants["gallery/photo-1.png"][1].path == "large/gallery/photo-1.jpg"
+    assert (tmp_path / "derived" / "thumb" / "gallery" / "photo-2.webp").exists()
+
+
+def test_process_media_plan_executor_skips_oversized_without_progress(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    raw_dir = tmp_path / "raw"
+    (raw_dir / "gallery").mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", (100, 100), color="red").save(raw_dir / "gallery" / "small.png")
+    Image.new("RGB", (400, 300), color="red").save(raw_dir / "gallery" / "huge.png")
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 20_000)
+    config = Config(
+        media_processing=MediaProcessingConfig(
+            source_dir=raw_dir,
+            output_dir=tmp_path / "derived",
+            profiles=[DerivativeProfile(name="thumb", width=64, height=64, format="webp")],
+            workers=2,
+        ),
+        gallery=GalleryConfig(source_dir=raw_dir / "gallery"),
+    )
+    plan = collect_media_plan([_doc("alpha", ["gallery/small.png", "gallery/huge.png"])], config)
+    progress: list[str] = []
+
+    executor = create_media_executor(config)
+    assert executor is not None
+    with executor:
+        result = process_media_plan(plan, config, on_progress=progress.append, executor=executor)
+
+    assert progress == ["derivative"]
+    assert result.processed_tasks == 1
+    assert result.skipped_tasks == 1
+    assert any("huge.png" in warning for warning in result.warnings)
+
+
+def test_apply_decompression_bomb_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 1000)
+    config = Config()
+    apply_decompression_bomb_limit(config)
+    assert Image.MAX_IMAGE_PIXELS == 1000
+    config.media_processing.decompression_bomb_limit = 500
+    apply_decompression_bomb_limit(config)
+    assert Image.MAX_IMAGE_PIXELS == 500
+    config.media_processing.decompression_bomb_limit = 0
+    apply_decompression_bomb_limit(config)
+    assert Image.MAX_IMAGE_PIXELS is None
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.config import Config
+from src.staging import stage_static_site
+
+
+def test_stage_static_site_copies_nested_template_assets(tmp_path: Path) -> None:
+    templates = tmp_path / "web"
+    for index in range(12):
+        asset = templates / "assets" / f"group-{index % 3}" / f"file-{index}.css"
+        asset.parent.mkdir(parents=True, exist_ok=True)
+        asset.write_text(f"/* {index} */", encoding="utf-8")
+    (templates / "index.html").write_text("<html></html>", encoding="utf-8")
+    output = tmp_path / "site"
+    stale = output / "assets" / "stale.css"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("old", encoding="utf-8")
+
+    config = Config(templates_dir=templates, output_dir=output)
+    result = stage_static_site(config)
+
+    assert (output / "index.html").exists()
+    assert not stale.exists()
+    copied = sorted(path.name for path in (output / "assets").rglob("*.css"))
+    assert copied == sorted(f"file-{index}.css" for index in range(12))
+    assert (output / "assets" / "group-1" / "file-4.css").read_text(encoding="utf-8") == "/* 4 */"
+    assert output / "assets" in result.template_paths
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.state import BuildState
+
+
+def test_build_state_save_replaces_file_atomically(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "build-state.json"
+    BuildState.empty().save(path)
+
+    state = BuildState(version=1, fingerprints={"content_dir": "abc"}, staged_template_paths=["css"])
+    state.save(path)
+
+    assert BuildState.load(path) == state
+    assert [entry.name for entry in path.parent.iterdir()] == ["build-state.json"]